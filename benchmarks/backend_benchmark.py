@@ -0,0 +1,109 @@
+"""Benchmark of homepage scans with the Selenium and Playwright backends.
+
+The pages are served locally, so only the cost of driving the browser and
+parsing the pages is measured. Both backends run the same number of scans
+with one worker, then with ``--concurrency`` workers: a Chrome instance per
+thread for Selenium and a page per coroutine for Playwright.
+"""
+
+import argparse
+import asyncio
+import functools
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from upwork_scraper.async_scanners import AsyncHomepageScanner
+from upwork_scraper.driver import ChromeDriver
+from upwork_scraper.homepage_scanner import HomepageScanner
+from upwork_scraper.mock_site import homepage
+from upwork_scraper.playwright_driver import PlaywrightBrowser
+
+
+def split_scans(scans: int, concurrency: int) -> list[int]:
+    """Split the scans evenly between the workers."""
+    return [len(range(worker, scans, concurrency)) for worker in range(concurrency)]
+
+
+def scan_with_selenium(homepage_url: str, scans: int, concurrency: int) -> float:
+    """Scan the homepage with a Chrome instance per worker thread."""
+    chrome_drivers = [ChromeDriver() for _ in range(concurrency)]
+
+    def scan_homepage(chrome_driver: ChromeDriver, worker_scans: int) -> None:
+        chrome_driver.homepage_url = homepage_url
+        for _ in range(worker_scans):
+            chrome_driver.go_to_url(homepage_url)
+            HomepageScanner(chrome_driver).scan_homepage()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(
+            executor.map(scan_homepage, chrome_drivers, split_scans(scans, concurrency))
+        )
+    seconds = time.perf_counter() - start
+    for chrome_driver in chrome_drivers:
+        chrome_driver.close()
+    return seconds
+
+
+async def scan_with_playwright(
+    homepage_url: str, scans: int, concurrency: int
+) -> float:
+    """Scan the homepage with a page per worker coroutine."""
+    async with PlaywrightBrowser() as browser:
+        session = await browser.new_session()
+        drivers = [await session.new_page() for _ in range(concurrency)]
+
+        async def scan_homepage(driver, worker_scans: int) -> None:
+            driver.homepage_url = homepage_url
+            for _ in range(worker_scans):
+                await driver.go_to_url(homepage_url)
+                await AsyncHomepageScanner(driver).scan_homepage()
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            *map(scan_homepage, drivers, split_scans(scans, concurrency))
+        )
+        seconds = time.perf_counter() - start
+        await session.close()
+    return seconds
+
+
+def main() -> None:
+    """Serve the pages locally and time both backends."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scans", type=int, default=20)
+    parser.add_argument("--cards", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=4)
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        Path(directory, "best-matches.html").write_text(homepage(arguments.cards))
+        Path(directory, "data").mkdir()
+        server = ThreadingHTTPServer(
+            ("127.0.0.1", 0),
+            functools.partial(SimpleHTTPRequestHandler, directory=directory),
+        )
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        homepage_url = f"http://127.0.0.1:{server.server_port}/best-matches.html"
+        os.chdir(directory)
+
+        for concurrency in sorted({1, arguments.concurrency}):
+            selenium = scan_with_selenium(homepage_url, arguments.scans, concurrency)
+            playwright = asyncio.run(
+                scan_with_playwright(homepage_url, arguments.scans, concurrency)
+            )
+            for backend, seconds in ("Selenium", selenium), ("Playwright", playwright):
+                print(
+                    f"{backend}, concurrency {concurrency}: {arguments.scans} scans "
+                    f"in {seconds:.2f} s, {arguments.scans / seconds:.1f} scans/s."
+                )
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
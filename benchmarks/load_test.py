@@ -0,0 +1,77 @@
+"""Load test of full scraping sessions against the local mock Upwork site.
+
+Every session runs the whole ``handler`` in its own Chrome, from the login
+to the profile scan, and many sessions run concurrently. The p50 and p95
+latency of each stage and the session throughput are reported.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from upwork_scraper.main import handler
+from upwork_scraper.mock_site import MockUpworkSite
+
+
+def run_session(_: int) -> Optional[dict[str, float]]:
+    """Run one full session in its own browser, None if it failed."""
+    start = time.perf_counter()
+    try:
+        timings = handler()
+    except Exception as error:
+        print(f"Session failed: {error!r}")
+        return None
+    return {**timings, "session": time.perf_counter() - start}
+
+
+def main() -> None:
+    """Serve the mock site and run the sessions against it."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--cards", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.05)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    site = MockUpworkSite(
+        cards=arguments.cards,
+        latency=arguments.latency,
+        jitter=arguments.jitter,
+        failure_rate=arguments.failure_rate,
+        seed=arguments.seed,
+    )
+    os.environ["USERNAME"] = site.username
+    os.environ["PASSWORD"] = site.password
+    with site, tempfile.TemporaryDirectory() as directory:
+        os.environ["UPWORK_URL"] = site.base_url
+        Path(directory, "data").mkdir()
+        os.chdir(directory)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(arguments.concurrency) as executor:
+            results = list(executor.map(run_session, range(arguments.sessions)))
+        seconds = time.perf_counter() - start
+
+    timings = [result for result in results if result is not None]
+    print(
+        f"{len(timings)}/{arguments.sessions} sessions succeeded in {seconds:.1f} s, "
+        f"{len(timings) / seconds:.2f} sessions/s, "
+        f"{site.failures}/{site.requests} requests failed."
+    )
+    for stage in ("login", "homepage", "profile", "session"):
+        values = [timing[stage] for timing in timings if stage in timing]
+        if values:
+            p50, p95 = np.percentile(values, [50, 95])
+            print(f"{stage:>8}: p50 {p50:.2f} s, p95 {p95:.2f} s.")
+
+
+if __name__ == "__main__":
+    main()
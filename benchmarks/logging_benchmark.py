@@ -0,0 +1,93 @@
+"""Benchmark of the per-call logging overhead on concurrent workers.
+
+Each worker thread logs the same INFO messages as a scan, timing only the
+``logger.info`` calls, once with a ``RichHandler`` rendering on the calling
+thread, as the logger used to, and once through the queue, with the
+background listener writing rich or JSON lines. The output goes to
+``/dev/null``, so only the cost of logging itself is measured.
+"""
+
+import argparse
+import logging
+import os
+import queue
+import statistics
+import sys
+import threading
+import time
+from logging.handlers import QueueListener
+
+from rich.console import Console
+from rich.logging import RichHandler
+
+from upwork_scraper.logger import (ContextQueueHandler, JsonFormatter,
+                                   log_context)
+
+
+def log_from_workers(logger: logging.Logger, workers: int, calls: int) -> list[float]:
+    """Log from concurrent workers and return the seconds of each call."""
+    seconds: list[float] = []
+    lock = threading.Lock()
+
+    def work(worker: int) -> None:
+        durations = []
+        with log_context(run=f"run-{worker}", account="worker@example.com"):
+            with log_context(stage="homepage"):
+                for call in range(calls):
+                    start = time.perf_counter()
+                    logger.info(f"Job section {call} parsed successfully.")
+                    durations.append(time.perf_counter() - start)
+        with lock:
+            seconds.extend(durations)
+
+    threads = [
+        threading.Thread(target=work, args=(worker,)) for worker in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return seconds
+
+
+def report(name: str, seconds: list[float]) -> None:
+    """Print the mean and p99 latency of the calls in microseconds."""
+    p99 = statistics.quantiles(seconds, n=100)[98]
+    print(
+        f"{name:>12}: mean {statistics.mean(seconds) * 1e6:.1f} us, "
+        f"p99 {p99 * 1e6:.1f} us per call."
+    )
+
+
+def main() -> None:
+    """Time the logging calls with each setup."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--calls", type=int, default=2_000)
+    arguments = parser.parse_args()
+    devnull = open(os.devnull, "w")
+    logger = logging.getLogger("logging_benchmark")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    rich_handler = RichHandler(console=Console(file=devnull), rich_tracebacks=True)
+    logger.handlers = [rich_handler]
+    report("inline rich", log_from_workers(logger, arguments.workers, arguments.calls))
+
+    json_handler = logging.StreamHandler(devnull)
+    json_handler.setFormatter(JsonFormatter())
+    for name, handler in (("queued rich", rich_handler), ("queued json", json_handler)):
+        records: queue.SimpleQueue = queue.SimpleQueue()
+        listener = QueueListener(records, handler)
+        logger.handlers = [ContextQueueHandler(records)]
+        listener.start()
+        seconds = log_from_workers(logger, arguments.workers, arguments.calls)
+        start = time.perf_counter()
+        listener.stop()
+        report(name, seconds)
+        print(f"{'':>12}  listener drained in {time.perf_counter() - start:.2f} s.")
+    print(f"Python {sys.version.split()[0]}, {os.cpu_count()} CPUs.")
+
+
+if __name__ == "__main__":
+    main()
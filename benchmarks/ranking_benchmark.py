@@ -0,0 +1,53 @@
+"""Benchmark of scoring synthetic jobs against a profile."""
+
+import argparse
+import random
+import tempfile
+import time
+
+from search_benchmark import SKILLS, WORDS, make_jobs
+
+from upwork_scraper.models.profile import ProfilePage
+from upwork_scraper.ranking import JobRanker, profile_terms
+from upwork_scraper.search import JobIndex
+
+
+def main() -> None:
+    """Index synthetic jobs and time ranking them against a profile."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    arguments = parser.parse_args()
+    generator = random.Random(0)
+    profile_page = ProfilePage(
+        job_title="Software engineer",
+        hourly_rate="$70.00/hr",
+        description=" ".join(generator.choices(WORDS, k=80)),
+        skills=generator.sample(SKILLS, 15),
+        employment_history=[],
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        index = JobIndex(directory)
+        index.add(make_jobs(arguments.jobs, 0, generator))
+        index.merge()
+
+        start = time.perf_counter()
+        ranker = JobRanker(index)
+        print(f"Built the job-term matrix in {time.perf_counter() - start:.3f} s.")
+
+        weights = profile_terms(profile_page)
+        start = time.perf_counter()
+        for _ in range(arguments.repeat):
+            ranker.score(weights)
+        seconds = (time.perf_counter() - start) / arguments.repeat
+        print(f"Scored {len(index)} jobs in {seconds:.3f} s.")
+
+        start = time.perf_counter()
+        shortlist = ranker.shortlist(profile_page)
+        seconds = time.perf_counter() - start
+        print(f"Shortlisted {len(shortlist)} jobs in {seconds:.3f} s.")
+
+
+if __name__ == "__main__":
+    main()
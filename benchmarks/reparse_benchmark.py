@@ -0,0 +1,61 @@
+"""Benchmark of re-parsing archived pages with more and more workers.
+
+An archive of synthetic homepage, contact info and profile captures is
+re-parsed with 1, 2, 4, ... worker processes up to the number of cores,
+reporting the pages per second and the speedup over one worker.
+"""
+
+import argparse
+import os
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from upwork_scraper.archive import PageArchive
+from upwork_scraper.mock_site import contact_info_page, homepage, profile_page
+from upwork_scraper.reparse import reparse
+
+
+def worker_counts(max_workers: int) -> list[int]:
+    """List the powers of two below the maximum, then the maximum."""
+    counts = []
+    workers = 1
+    while workers < max_workers:
+        counts.append(workers)
+        workers *= 2
+    return counts + [max_workers]
+
+
+def main() -> None:
+    """Archive synthetic captures and time re-parsing them."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--captures", type=int, default=600)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        archive = PageArchive(Path(directory, "archive"))
+        start = datetime(2023, 11, 13)
+        for index in range(arguments.captures):
+            captured_at = start + timedelta(minutes=index)
+            if index % 3 == 0:
+                archive.add("dave", "homepage", homepage(30 + index % 20), captured_at)
+            elif index % 3 == 1:
+                archive.add("dave", "contactinfo", contact_info_page(), captured_at)
+            else:
+                archive.add("dave", "profilepage", profile_page(), captured_at)
+        archive.close()
+
+        baseline = None
+        for workers in worker_counts(arguments.max_workers):
+            output_dir = Path(directory, f"output-{workers}")
+            stats = reparse(Path(directory, "archive"), output_dir, workers)
+            baseline = baseline or stats.pages_per_second
+            print(
+                f"{workers:>3} workers: {stats.pages_per_second:.1f} pages/s, "
+                f"speedup {stats.pages_per_second / baseline:.2f}x."
+            )
+
+
+if __name__ == "__main__":
+    main()
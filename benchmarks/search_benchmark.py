@@ -0,0 +1,81 @@
+"""Benchmark of the job index query latency on synthetic jobs."""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from upwork_scraper.search import JobIndex
+
+SKILLS = [f"Skill {index}" for index in range(2000)]
+WORDS = [f"word{index}" for index in range(20000)]
+COUNTRIES = [f"Country {index}" for index in range(150)]
+JOB_TYPES = ["Fixed-price", "Hourly"]
+QUERIES = [
+    {"must": ["skill:Skill 1"]},
+    {"must": ["skill:Skill 1", "term:word5"]},
+    {"should": ["skill:Skill 2", "skill:Skill 3"], "must_not": ["job_type:Hourly"]},
+    {"must": ["country:Country 7"], "budget": (100, 1000)},
+    {"posted_on": (datetime(2023, 11, 1), datetime(2023, 11, 8))},
+    {"must": ["term:word10"], "posted_on": (datetime(2023, 11, 1), None)},
+]
+
+
+def make_jobs(count: int, start: int, generator: random.Random) -> list[dict]:
+    """Make synthetic job sections."""
+    first_day = datetime(2023, 1, 1)
+    return [
+        {
+            "title": f"Job {index}",
+            "suffix_link": f"/jobs/~{index:012d}",
+            "description": " ".join(generator.choices(WORDS, k=40)),
+            "skills": generator.sample(SKILLS, 5),
+            "country": generator.choice(COUNTRIES),
+            "job_type": generator.choice(JOB_TYPES),
+            "budget": str(generator.randint(5, 5000)),
+            "posted_on": (
+                first_day + timedelta(minutes=generator.randint(0, 500000))
+            ).isoformat(),
+        }
+        for index in range(start, start + count)
+    ]
+
+
+def main() -> None:
+    """Build an index of synthetic jobs and time the queries."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    arguments = parser.parse_args()
+    generator = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as directory:
+        index = JobIndex(directory)
+        start = time.perf_counter()
+        for first in range(0, arguments.jobs, arguments.batch):
+            count = min(arguments.batch, arguments.jobs - first)
+            index.add(make_jobs(count, first, generator))
+        print(f"Indexed {len(index)} jobs in {time.perf_counter() - start:.1f} s.")
+
+        start = time.perf_counter()
+        index.add(make_jobs(30, len(index), generator))
+        print(f"Added a scan of 30 jobs in {time.perf_counter() - start:.3f} s.")
+
+        for query in QUERIES:
+            timings = []
+            for _ in range(arguments.repeat):
+                start = time.perf_counter()
+                results = index.search(**query, limit=50)
+                timings.append((time.perf_counter() - start) * 1000)
+            print(
+                f"{query}: {len(results)} results, "
+                f"median {statistics.median(timings):.2f} ms, "
+                f"max {max(timings):.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
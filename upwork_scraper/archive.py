@@ -0,0 +1,322 @@
+"""A module for archiving the raw page sources of every scan."""
+
+import bisect
+import hashlib
+import heapq
+import json
+import mmap
+import re
+import threading
+import zlib
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from pydantic import BaseModel
+
+from upwork_scraper.storage import DEFAULT_ACCOUNT
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Chunks are cut after closing tags, so repeated markup such as job cards
+# ends up in identical chunks wherever it appears in the page.
+CLOSING_TAG = re.compile(rb"</[a-zA-Z][a-zA-Z0-9]*>")
+MIN_CHUNK_SIZE: int = 1024
+MAX_CHUNK_SIZE: int = 64 * 1024
+BOUNDARY_MASK: int = 0x1F
+BOUNDARY_WINDOW: int = 48
+
+
+def split_into_chunks(data: bytes) -> list[bytes]:
+    """Split data into content-defined chunks.
+
+    A closing tag ends a chunk when the hash of the bytes before it matches
+    the boundary mask, so the cuts only depend on the nearby content and an
+    edit in one place does not shift every chunk after it.
+    """
+    chunks = []
+    start = 0
+    for match in CLOSING_TAG.finditer(data):
+        end = match.end()
+        size = end - start
+        if size < MIN_CHUNK_SIZE:
+            continue
+        window = data[end - BOUNDARY_WINDOW : end]
+        if zlib.crc32(window) & BOUNDARY_MASK == 0 or size >= MAX_CHUNK_SIZE:
+            chunks.append(data[start:end])
+            start = end
+    if start < len(data):
+        chunks.append(data[start:])
+    return chunks
+
+
+class Codec:
+    """A compression codec for the chunks, gzip unless zstd is asked for.
+
+    zstd compresses better but needs the optional `zstandard` package to read
+    the archive back, so it is only used when requested.
+    """
+
+    def __init__(self, name: Optional[str] = None):
+        """Initialize the Codec, gzip by default."""
+        self.name = name or "gzip"
+        if self.name == "zstd":
+            if zstandard is None:
+                raise ValueError("The zstandard package is required for zstd.")
+            self._compressor = zstandard.ZstdCompressor(level=10)
+            self._decompressor = zstandard.ZstdDecompressor()
+        elif self.name != "gzip":
+            raise ValueError(f"Unknown codec: {self.name}.")
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress the specified data."""
+        if self.name == "zstd":
+            return self._compressor.compress(data)
+        return zlib.compress(data, 9)
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress the specified data."""
+        if self.name == "zstd":
+            return self._decompressor.decompress(data)
+        return zlib.decompress(data)
+
+
+class Capture(BaseModel):
+    """A Pydantic BaseModel representing a captured page source."""
+
+    account: str
+    page_type: str
+    captured_at: datetime
+    url: Optional[str] = None
+    size: int
+    chunks: list[str]
+
+
+class ArchiveStats(BaseModel):
+    """A Pydantic BaseModel representing the storage used by an archive."""
+
+    captures: int
+    chunks: int
+    raw_bytes: int
+    unique_bytes: int
+    stored_bytes: int
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Return the ratio of captured bytes to unique chunk bytes."""
+        return self.raw_bytes / self.unique_bytes if self.unique_bytes else 1.0
+
+    @property
+    def compression_ratio(self) -> float:
+        """Return the ratio of unique chunk bytes to compressed bytes."""
+        return self.unique_bytes / self.stored_bytes if self.stored_bytes else 1.0
+
+    @property
+    def total_ratio(self) -> float:
+        """Return the ratio of captured bytes to bytes stored on disk."""
+        return self.raw_bytes / self.stored_bytes if self.stored_bytes else 1.0
+
+
+class PageArchive:
+    """A content-addressed archive of compressed page sources.
+
+    Page sources are split into chunks, which are compressed and stored once
+    per distinct content in an append-only ``chunks.bin`` file. Captures list
+    the hashes of their chunks and are indexed by account, page type and
+    capture time. Reads go through a memory map of ``chunks.bin``. Writers
+    hold a lock on ``archive.lock`` while appending, so several processes or
+    instances can share one archive (on POSIX systems).
+    """
+
+    def __init__(self, path: Union[str, Path], codec: Optional[str] = None):
+        """Initialize the PageArchive, loading it if it already exists."""
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._chunks_path = self.path / "chunks.bin"
+        self._chunk_index_path = self.path / "chunks.jsonl"
+        self._captures_path = self.path / "captures.jsonl"
+        self._meta_path = self.path / "meta.json"
+
+        if self._meta_path.exists():
+            meta = json.loads(self._meta_path.read_text())
+            self.codec = Codec(meta["codec"])
+        else:
+            self.codec = Codec(codec)
+            self._meta_path.write_text(json.dumps({"codec": self.codec.name}))
+
+        # hash -> (offset, stored length, raw size)
+        self._chunks: dict[str, tuple[int, int, int]] = {}
+        self._captures: list[Capture] = []
+        # (account, page type) -> captures and their times, oldest first
+        self._captures_by_key: dict[tuple[str, str], list[Capture]] = {}
+        self._times_by_key: dict[tuple[str, str], list[datetime]] = {}
+        self._chunk_index_position = 0
+        self._captures_position = 0
+        self._thread_lock = threading.Lock()
+        self._chunks_path.touch()
+        self._chunk_index_path.touch()
+        self._captures_path.touch()
+        self._load_new_entries()
+        self._mmap: Optional[mmap.mmap] = None
+
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        """Hold the archive lock, shared by all the writers of the archive."""
+        with self._thread_lock, (self.path / "archive.lock").open("a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _read_new_lines(path: Path, position: int) -> tuple[list[str], int]:
+        """Read the complete lines written after the position."""
+        with path.open("rb") as file:
+            file.seek(position)
+            data = file.read()
+        end = data.rfind(b"\n") + 1
+        return data[:end].decode().splitlines(), position + end
+
+    def _load_new_entries(self) -> None:
+        """Load the chunks and captures written since the last load."""
+        lines, self._chunk_index_position = self._read_new_lines(
+            self._chunk_index_path, self._chunk_index_position
+        )
+        for line in lines:
+            key, offset, length, size = line.split()
+            self._chunks[key] = (int(offset), int(length), int(size))
+        lines, self._captures_position = self._read_new_lines(
+            self._captures_path, self._captures_position
+        )
+        for line in lines:
+            self._index_capture(Capture.model_validate_json(line))
+
+    def _index_capture(self, capture: Capture) -> None:
+        """Add the capture to the index by account, page type and time."""
+        self._captures.append(capture)
+        key = (capture.account, capture.page_type)
+        times = self._times_by_key.setdefault(key, [])
+        position = bisect.bisect_right(times, capture.captured_at)
+        times.insert(position, capture.captured_at)
+        self._captures_by_key.setdefault(key, []).insert(position, capture)
+
+    def add(
+        self,
+        account: str,
+        page_type: str,
+        source: str,
+        captured_at: Optional[datetime] = None,
+        url: Optional[str] = None,
+    ) -> Capture:
+        """Add a page source to the archive."""
+        data = source.encode()
+        keys = []
+        with self._lock():
+            # Other writers may have appended since, so catch up under the lock
+            # and take the offset from the actual end of the file.
+            self._load_new_entries()
+            with self._chunks_path.open("ab") as chunks_file:
+                offset = chunks_file.seek(0, 2)
+                index_lines = []
+                for chunk in split_into_chunks(data):
+                    key = hashlib.blake2b(chunk, digest_size=16).hexdigest()
+                    if key not in self._chunks:
+                        compressed = self.codec.compress(chunk)
+                        chunks_file.write(compressed)
+                        self._chunks[key] = (offset, len(compressed), len(chunk))
+                        index_lines.append(
+                            f"{key} {offset} {len(compressed)} {len(chunk)}\n"
+                        )
+                        offset += len(compressed)
+                    keys.append(key)
+            with self._chunk_index_path.open("ab") as index_file:
+                index_file.write("".join(index_lines).encode())
+                self._chunk_index_position = index_file.tell()
+
+            capture = Capture(
+                account=account or DEFAULT_ACCOUNT,
+                page_type=page_type,
+                captured_at=captured_at or datetime.now(),
+                url=url,
+                size=len(data),
+                chunks=keys,
+            )
+            with self._captures_path.open("ab") as file:
+                file.write((capture.model_dump_json() + "\n").encode())
+                self._captures_position = file.tell()
+            self._index_capture(capture)
+        return capture
+
+    def captures(
+        self,
+        account: Optional[str] = None,
+        page_type: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> list[Capture]:
+        """List the captures matching the specified filters, oldest first."""
+        matches = []
+        for (key_account, key_page_type), times in self._times_by_key.items():
+            if account is not None and key_account != account:
+                continue
+            if page_type is not None and key_page_type != page_type:
+                continue
+            start = 0 if since is None else bisect.bisect_left(times, since)
+            end = len(times) if until is None else bisect.bisect_right(times, until)
+            captures = self._captures_by_key[(key_account, key_page_type)]
+            matches.append(captures[start:end])
+        return list(heapq.merge(*matches, key=lambda capture: capture.captured_at))
+
+    def __iter__(self) -> Iterator[Capture]:
+        """Iterate over all captures, oldest first."""
+        return iter(self.captures())
+
+    def __len__(self) -> int:
+        """Return the number of captures."""
+        return len(self._captures)
+
+    def get(self, capture: Capture) -> str:
+        """Get the page source of the specified capture."""
+        return b"".join(self._read_chunk(key) for key in capture.chunks).decode()
+
+    def _read_chunk(self, key: str) -> bytes:
+        """Read and decompress the chunk stored under the specified key."""
+        offset, length, _ = self._chunks[key]
+        if self._mmap is None or len(self._mmap) < offset + length:
+            self._remap()
+        return self.codec.decompress(self._mmap[offset : offset + length])
+
+    def _remap(self) -> None:
+        """Memory map the chunks file again after it has grown."""
+        if self._mmap is not None:
+            self._mmap.close()
+        with self._chunks_path.open("rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def stats(self) -> ArchiveStats:
+        """Get the storage statistics of the archive."""
+        return ArchiveStats(
+            captures=len(self._captures),
+            chunks=len(self._chunks),
+            raw_bytes=sum(capture.size for capture in self._captures),
+            unique_bytes=sum(size for _, _, size in self._chunks.values()),
+            stored_bytes=sum(length for _, length, _ in self._chunks.values()),
+        )
+
+    def close(self) -> None:
+        """Close the memory map of the archive."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
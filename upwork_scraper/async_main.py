@@ -0,0 +1,71 @@
+"""Main module running the scan on the asynchronous Playwright backend."""
+
+import argparse
+import asyncio
+import os
+import uuid
+from typing import Awaitable, Optional
+
+from dotenv import load_dotenv
+
+from upwork_scraper.archive import PageArchive
+from upwork_scraper.async_scanners import (AsyncHomepageScanner,
+                                           AsyncLoginHandler,
+                                           AsyncProfileScanner)
+from upwork_scraper.browser import AsyncBrowserSession
+from upwork_scraper.driver import BASE_URL
+from upwork_scraper.logger import log_context, logger
+
+
+async def in_log_context(awaitable: Awaitable[None], **fields: str) -> None:
+    """Await with the context fields attached to the records it logs."""
+    with log_context(**fields):
+        await awaitable
+
+
+async def scan(
+    session: AsyncBrowserSession, archive: Optional[PageArchive] = None
+) -> None:
+    """Log in, then scan the homepage and the profile on two pages at once."""
+    homepage_driver = await session.new_page()
+    profile_driver = await session.new_page()
+    try:
+        await in_log_context(AsyncLoginHandler(homepage_driver).login(), stage="login")
+        logger.info("Login successful.")
+
+        homepage_scanner = AsyncHomepageScanner(homepage_driver, archive)
+        profile_scanner = AsyncProfileScanner(profile_driver, archive)
+        await asyncio.gather(
+            in_log_context(homepage_scanner.scan_homepage(), stage="homepage"),
+            in_log_context(profile_scanner.scan_profile(), stage="profile"),
+        )
+        logger.info("Homepage and profile scanned successfully.")
+    finally:
+        await session.close()
+
+
+async def async_handler(sessions: int = 1, headless: bool = True) -> None:
+    """Run the specified number of sessions concurrently in one browser."""
+    # Playwright is an optional dependency, only needed for this backend.
+    from upwork_scraper.playwright_driver import PlaywrightBrowser
+
+    load_dotenv()
+    archive_path = os.getenv("ARCHIVE_PATH")
+    archive = PageArchive(archive_path) if archive_path else None
+    base_url = os.getenv("UPWORK_URL", BASE_URL)
+    async with PlaywrightBrowser(headless=headless, base_url=base_url) as browser:
+        browser_sessions = [await browser.new_session() for _ in range(sessions)]
+        with log_context(account=os.getenv("USERNAME")):
+            await asyncio.gather(
+                *(
+                    in_log_context(scan(session, archive), run=uuid.uuid4().hex[:12])
+                    for session in browser_sessions
+                )
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scan with the async backend.")
+    parser.add_argument("--sessions", type=int, default=1, help="Sessions to run.")
+    arguments = parser.parse_args()
+    asyncio.run(async_handler(arguments.sessions))
@@ -0,0 +1,83 @@
+"""A module with the scanners running as coroutines on an async browser.
+
+The scanners run the same steps as the synchronous ones, awaiting the
+browser commands and running the parsing and storing in a thread.
+"""
+
+import asyncio
+import functools
+from datetime import datetime
+from typing import Callable, Optional
+
+from upwork_scraper.archive import PageArchive
+from upwork_scraper.browser import AsyncBrowser
+from upwork_scraper.driver import DriverManager
+from upwork_scraper.logger import logger
+from upwork_scraper.models.profile import Profile
+from upwork_scraper.scan_steps import (homepage_steps, login_steps,
+                                       profile_steps, run_async_steps)
+
+
+def async_retry(tries: int = 3, delay: float = 2, backoff: float = 2) -> Callable:
+    """Retry a coroutine on any exception, like ``retry`` does for functions."""
+
+    def decorator(coroutine: Callable) -> Callable:
+        @functools.wraps(coroutine)
+        async def wrapper(*args, **kwargs):
+            wait = delay
+            for attempt in range(1, tries + 1):
+                try:
+                    return await coroutine(*args, **kwargs)
+                except Exception as error:
+                    if attempt == tries:
+                        raise
+                    logger.warning(f"{error}, retrying in {wait} seconds...")
+                    await asyncio.sleep(wait)
+                    wait *= backoff
+
+        return wrapper
+
+    return decorator
+
+
+class AsyncLoginHandler(DriverManager):
+    """A class for handling the login process."""
+
+    def __init__(self, driver: AsyncBrowser):
+        """Initialize the AsyncLoginHandler with the specified page."""
+        super().__init__(driver)
+
+    @async_retry()
+    async def login(self) -> None:
+        """Perform the login process."""
+        await run_async_steps(self.driver, login_steps(self))
+
+
+class AsyncHomepageScanner(DriverManager):
+    """A class for scanning the Upwork homepage for job sections."""
+
+    def __init__(self, driver: AsyncBrowser, archive: Optional[PageArchive] = None):
+        """Initialize the AsyncHomepageScanner with the specified page."""
+        super().__init__(driver, archive)
+        self.job_sections: list[dict] = []
+        self.datetime_now: str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    @async_retry()
+    async def scan_homepage(self) -> None:
+        """Scan the Upwork homepage for job sections."""
+        self.job_sections = await run_async_steps(self.driver, homepage_steps(self))
+
+
+class AsyncProfileScanner(DriverManager):
+    """A class for scanning the Upwork Profile information."""
+
+    def __init__(self, driver: AsyncBrowser, archive: Optional[PageArchive] = None):
+        """Initialize the AsyncProfileScanner with the specified page."""
+        super().__init__(driver, archive)
+        self.datetime_now: str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.profile: Profile
+
+    @async_retry()
+    async def scan_profile(self) -> None:
+        """Scan the Upwork Profile page and store its changed sections."""
+        self.profile = await run_async_steps(self.driver, profile_steps(self))
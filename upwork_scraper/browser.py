@@ -0,0 +1,139 @@
+"""A module defining the interfaces the scanners use to drive a browser."""
+
+from abc import ABC, abstractmethod
+
+
+class Browser(ABC):
+    """The interface of a synchronous browser driver used by the scanners."""
+
+    timeout: int
+    timeout_for_checking_presence: int
+    login_url: str
+    homepage_url: str
+    contact_info_url: str
+
+    @abstractmethod
+    def go_to_url(self, url: str) -> None:
+        """Navigate to the specified URL."""
+
+    @abstractmethod
+    def enter_text_when_loaded(self, element_content: str, text: str) -> None:
+        """Enter text after element is loaded."""
+
+    @abstractmethod
+    def click_element(self, element_content: str) -> None:
+        """Click the specified element."""
+
+    @abstractmethod
+    def get_profile_link(self, pattern: str) -> str:
+        """Get the link containing the specified pattern."""
+
+    @abstractmethod
+    def is_logged(self) -> bool:
+        """Check if the user is logged in."""
+
+    @abstractmethod
+    def is_at_login_page(self) -> bool:
+        """Check if the browser is at the login page, not logged in yet."""
+
+    @abstractmethod
+    def is_at_homepage(self) -> bool:
+        """Check if the browser is at the homepage."""
+
+    @abstractmethod
+    def is_at_contact_info_page(self) -> bool:
+        """Check if the browser is at the contact info page."""
+
+    @abstractmethod
+    def is_at_profile_page(self) -> bool:
+        """Check if the browser is at the profile page."""
+
+    @abstractmethod
+    def get_page_source(self) -> str:
+        """Get the page source of the current webpage."""
+
+    @abstractmethod
+    def is_element_present(self, element_content: str) -> bool:
+        """Check if the element is present."""
+
+    @abstractmethod
+    def is_element_present_by_xpath(self, element_content: str) -> bool:
+        """Check if the element is present."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Close the browser."""
+
+
+class AsyncBrowser(ABC):
+    """The interface of an asynchronous browser page used by the scanners."""
+
+    timeout: int
+    timeout_for_checking_presence: int
+    login_url: str
+    homepage_url: str
+    contact_info_url: str
+
+    @abstractmethod
+    async def go_to_url(self, url: str) -> None:
+        """Navigate to the specified URL."""
+
+    @abstractmethod
+    async def enter_text_when_loaded(self, element_content: str, text: str) -> None:
+        """Enter text after element is loaded."""
+
+    @abstractmethod
+    async def click_element(self, element_content: str) -> None:
+        """Click the specified element."""
+
+    @abstractmethod
+    async def get_profile_link(self, pattern: str) -> str:
+        """Get the link containing the specified pattern."""
+
+    @abstractmethod
+    async def is_logged(self) -> bool:
+        """Check if the user is logged in."""
+
+    @abstractmethod
+    async def is_at_login_page(self) -> bool:
+        """Check if the page is the login page, not logged in yet."""
+
+    @abstractmethod
+    async def is_at_homepage(self) -> bool:
+        """Check if the page is the homepage."""
+
+    @abstractmethod
+    async def is_at_contact_info_page(self) -> bool:
+        """Check if the page is the contact info page."""
+
+    @abstractmethod
+    async def is_at_profile_page(self) -> bool:
+        """Check if the page is the profile page."""
+
+    @abstractmethod
+    async def get_page_source(self) -> str:
+        """Get the page source of the current webpage."""
+
+    @abstractmethod
+    async def is_element_present(self, element_content: str) -> bool:
+        """Check if the element is present."""
+
+    @abstractmethod
+    async def is_element_present_by_xpath(self, element_content: str) -> bool:
+        """Check if the element is present."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close the page."""
+
+
+class AsyncBrowserSession(ABC):
+    """A logged in browser session whose pages share the cookies."""
+
+    @abstractmethod
+    async def new_page(self) -> AsyncBrowser:
+        """Open a new page in the session."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close the session and its pages."""
@@ -0,0 +1,164 @@
+"""A module for managing persistent Chrome profiles per account."""
+
+import json
+import os
+import re
+import shutil
+import time
+from datetime import timedelta
+from pathlib import Path
+from statistics import mean
+from typing import IO, Optional, Union
+
+from upwork_scraper.logger import logger
+from upwork_scraper.storage import DEFAULT_ACCOUNT
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+CACHE_SIZE: int = 200 * 1024 * 1024
+MAX_AGE: timedelta = timedelta(days=14)
+# Number of times to first card kept per profile state.
+TIMINGS_KEPT: int = 20
+
+
+class BrowserProfile:
+    """A persistent Chrome user data directory for an account.
+
+    Keeping the profile between runs lets Chrome reuse its HTTP cache, so the
+    Upwork scripts, styles and fonts are not downloaded again on every run.
+    Each account has numbered slots, each guarded by a lock file, so that
+    concurrent workers never share a profile, where ``fcntl`` is available.
+    Slots which have not been used for ``max_age`` are removed when a profile
+    is acquired.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        account: Optional[str],
+        cache_size: int = CACHE_SIZE,
+        max_age: timedelta = MAX_AGE,
+    ):
+        """Initialize the BrowserProfile for the specified account."""
+        self.root = Path(root)
+        account = account or DEFAULT_ACCOUNT
+        self.account_dir = self.root / re.sub(r"[^\w.-]", "_", account)
+        self.cache_size = cache_size
+        self.max_age = max_age
+        self.path: Optional[Path] = None
+        self.is_warm: bool = False
+        self._lock_file: Optional[IO] = None
+
+    def acquire(self) -> Path:
+        """Lock the first free slot of the account and return its path."""
+        self.prune()
+        self.account_dir.mkdir(parents=True, exist_ok=True)
+        slot = 0
+        while True:
+            path = self.account_dir / f"slot-{slot}"
+            lock_file = self._try_lock(path)
+            if lock_file is not None:
+                break
+            slot += 1
+        self._lock_file = lock_file
+        self.path = path
+        self.is_warm = (path / "last-used").exists()
+        path.mkdir(exist_ok=True)
+        logger.info(f"Using {'warm' if self.is_warm else 'cold'} profile {path}.")
+        return path
+
+    def release(self) -> None:
+        """Mark the profile as used and unlock it."""
+        if self._lock_file is None:
+            return
+        (self.path / "last-used").touch()
+        self._unlock(self._lock_file)
+        self._lock_file = None
+
+    def chrome_arguments(self) -> list[str]:
+        """Get the Chrome arguments using the acquired profile."""
+        return [
+            f"--user-data-dir={self.path}",
+            f"--disk-cache-size={self.cache_size}",
+        ]
+
+    def prune(self) -> None:
+        """Remove the profiles, of any account, unused for ``max_age``.
+
+        A slot is aged by its last release, or by its directory if it was
+        never released, e.g. after a crash. Its lock file is removed too.
+        """
+        oldest = time.time() - self.max_age.total_seconds()
+        for path in self.root.glob("*/slot-*"):
+            if not path.is_dir():
+                continue
+            marker = path / "last-used"
+            used_at = max(
+                path.stat().st_mtime,
+                marker.stat().st_mtime if marker.exists() else 0.0,
+            )
+            if used_at >= oldest:
+                continue
+            lock_file = self._try_lock(path)
+            if lock_file is None:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            self._lock_path(path).unlink(missing_ok=True)
+            logger.info(f"Removed stale profile {path}.")
+            self._unlock(lock_file)
+
+    @staticmethod
+    def _lock_path(path: Path) -> Path:
+        """Get the path of the lock file of a slot."""
+        return path.with_name(f"{path.name}.lock")
+
+    @classmethod
+    def _try_lock(cls, path: Path) -> Optional[IO]:
+        """Lock the slot at the specified path, None if it is in use."""
+        lock_path = cls._lock_path(path)
+        lock_file = lock_path.open("a")
+        if fcntl is None:
+            return lock_file
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            return None
+        # The lock file may have been removed by a prune since it was opened.
+        if not lock_path.exists() or not os.path.samestat(
+            os.fstat(lock_file.fileno()), lock_path.stat()
+        ):
+            cls._unlock(lock_file)
+            return None
+        return lock_file
+
+    @staticmethod
+    def _unlock(lock_file: IO) -> None:
+        """Unlock and close the lock file of a slot."""
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+        lock_file.close()
+
+    def record_time_to_first_card(self, seconds: float) -> None:
+        """Record the time to first card and report cold versus warm times."""
+        timings_path = self.account_dir / "timings.json"
+        timings = (
+            json.loads(timings_path.read_text())
+            if timings_path.exists()
+            else {"cold": [], "warm": []}
+        )
+        state = "warm" if self.is_warm else "cold"
+        timings[state] = (timings[state] + [seconds])[-TIMINGS_KEPT:]
+        timings_path.write_text(json.dumps(timings))
+
+        message = f"Time to first card with a {state} profile: {seconds:.2f} s."
+        if timings["cold"] and timings["warm"]:
+            cold, warm = mean(timings["cold"]), mean(timings["warm"])
+            message += (
+                f" Average cold: {cold:.2f} s, average warm: {warm:.2f} s, "
+                f"difference: {cold - warm:.2f} s."
+            )
+        logger.info(message)
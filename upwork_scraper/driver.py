@@ -1,8 +1,11 @@
 """A module for managing the Webdriver."""
 
+import functools
 import os
 import re
-from typing import Any
+from typing import Any, Callable, Optional, Union
+
+import psutil
 from retry import retry
 from selenium import webdriver
 from selenium.common.exceptions import TimeoutException
@@ -13,23 +16,93 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 
+from upwork_scraper.archive import PageArchive
+from upwork_scraper.browser import AsyncBrowser, Browser
+from upwork_scraper.browser_profile import BrowserProfile
 from upwork_scraper.logger import logger
+from upwork_scraper.recording import Recording
+
+BASE_URL: str = "https://www.upwork.com"
+LOGIN_PATH: str = "/ab/account-security/login"
+HOMEPAGE_PATH: str = "/nx/find-work/best-matches"
+CONTACT_INFO_PATH: str = "/freelancers/settings/contactInfo"
+PROFILE_PATH: str = "/freelancers/~"
+LOGIN_URL: str = BASE_URL + LOGIN_PATH
+HOMEPAGE_URL: str = BASE_URL + HOMEPAGE_PATH
+CONTACT_INFO_URL: str = BASE_URL + CONTACT_INFO_PATH
+JOB_CARD_CLASS: str = "up-card-section.up-card-list-section.up-card-hover"
+
+
+def recorded(secret: bool = False) -> Callable:
+    """Record the call and its result when the driver is recording.
+
+    When ``secret`` is set, the last argument (e.g. a password) is left out
+    of the recording. A call that raised is recorded with its error.
+    """
+
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args):
+            if self.recording is None:
+                return method(self, *args)
+            stored_args = args[:-1] if secret else args
+            try:
+                result = method(self, *args)
+            except Exception as error:
+                self.recording.add_call(
+                    method.__name__, stored_args, None, self._driver.current_url, error
+                )
+                raise
+            self.recording.add_call(
+                method.__name__, stored_args, result, self._driver.current_url
+            )
+            return result
+
+        return wrapper
 
+    return decorator
 
-class ChromeDriver:
+
+class ChromeDriver(Browser):
     """A class to manage the Selenium webdriver for Google Chrome."""
 
-    def __init__(self, headless: bool = True):
-        """Initialize the ChromeDriver with the specified configuration."""
+    def __init__(
+        self,
+        headless: bool = True,
+        record_path: Optional[str] = None,
+        profile: Optional[BrowserProfile] = None,
+        base_url: str = BASE_URL,
+    ):
+        """Initialize the ChromeDriver with the specified configuration.
+
+        If ``record_path`` is given, every interaction is recorded and saved
+        there on ``close`` so it can be served back by a ``ReplayDriver``.
+        If ``profile`` is given, Chrome runs with that persistent profile
+        instead of a fresh incognito one, reusing its cache between runs.
+        ``base_url`` points the driver to another site than Upwork, such as
+        the ``mock_site``.
+        """
         self.timeout: int = 10
         self.timeout_for_checking_presence: int = 3
         self.headless = headless
-        self._driver = self._create_driver()
-        self.login_url: str = "https://www.upwork.com/ab/account-security/login"
-        self.homepage_url: str = "https://www.upwork.com/nx/find-work/best-matches"
-        self.contact_info_url: str = (
-            "https://www.upwork.com/freelancers/settings/contactInfo"
+        self.record_path = record_path
+        self.recording: Optional[Recording] = (
+            Recording(base_url=base_url) if record_path else None
         )
+        self.profile = profile
+        self.time_to_first_card: Optional[float] = None
+        if self.profile is not None:
+            self.profile.acquire()
+        try:
+            self._driver = self._create_driver()
+        except Exception:
+            if self.profile is not None:
+                self.profile.release()
+            raise
+        self.login_url: str = base_url + LOGIN_PATH
+        self.homepage_url: str = base_url + HOMEPAGE_PATH
+        self.contact_info_url: str = base_url + CONTACT_INFO_PATH
+        self.profile_url: str = base_url + PROFILE_PATH
 
     @retry(exceptions=Exception, tries=3, delay=2)
     def _create_driver(self) -> webdriver.Chrome:
@@ -43,7 +116,11 @@ class ChromeDriver:
         )
         options.add_argument("--window-size=1920x1080")
         options.add_argument("--no-sandbox")
-        options.add_argument("--incognito")
+        if self.profile is not None:
+            for argument in self.profile.chrome_arguments():
+                options.add_argument(argument)
+        else:
+            options.add_argument("--incognito")
         options.add_argument("--disable-gpu")
         options.add_argument("--disable-dev-shm-usage")
         options.add_argument(
@@ -59,22 +136,30 @@ class ChromeDriver:
             options=options, service=Service(ChromeDriverManager().install())
         )
 
+    @recorded()
     def go_to_url(self, url: str) -> None:
         """Navigate the ChromeDriver to the specified URL."""
         self._driver.get(url)
+        if url == self.homepage_url and self._driver.find_elements(
+            By.CLASS_NAME, JOB_CARD_CLASS
+        ):
+            self._record_first_card()
 
+    @recorded(secret=True)
     def enter_text_when_loaded(self, element_content: str, text: str) -> None:
         """Enter text after element is loaded."""
         self._wait_until_loaded(EC.element_to_be_clickable((By.ID, element_content)))
         element = self._get_element_by_id(element_content)
         element.send_keys(text)
 
+    @recorded()
     def click_element(self, element_content: str) -> None:
         """Click the specified element."""
         self._wait_until_loaded(EC.element_to_be_clickable((By.ID, element_content)))
         element = self._get_element_by_id(element_content)
         element.click()
 
+    @recorded()
     def get_profile_link(self, pattern: str) -> str:
         """Click the specified element."""
         href_pattern = re.compile(f"{pattern}")
@@ -100,6 +185,7 @@ class ChromeDriver:
         """Get the specified element."""
         return self._driver.find_element(By.XPATH, element_content)
 
+    @recorded()
     def is_logged(self) -> bool:
         """Check if the user is logged in."""
         try:
@@ -110,6 +196,21 @@ class ChromeDriver:
         except TimeoutException:
             return False
 
+    @recorded()
+    def is_at_login_page(self) -> bool:
+        """Check if the ChromeDriver is at the login page, not logged in yet."""
+        try:
+            WebDriverWait(self._driver, self.timeout).until(
+                EC.any_of(
+                    EC.presence_of_element_located((By.ID, "login_username")),
+                    EC.presence_of_element_located((By.ID, "nav-notifications-label")),
+                )
+            )
+        except TimeoutException:
+            return True
+        return bool(self._driver.find_elements(By.ID, "login_username"))
+
+    @recorded()
     def is_at_homepage(self) -> bool:
         """Check if the ChromeDriver is at the homepage."""
         try:
@@ -117,18 +218,28 @@ class ChromeDriver:
                 EC.url_to_be(self.homepage_url)
             )
             WebDriverWait(self._driver, self.timeout).until(
-                lambda driver: len(
-                    driver.find_elements(
-                        By.CLASS_NAME,
-                        "up-card-section.up-card-list-section.up-card-hover",
-                    )
-                )
+                EC.presence_of_element_located((By.CLASS_NAME, JOB_CARD_CLASS))
+            )
+            self._record_first_card()
+            WebDriverWait(self._driver, self.timeout).until(
+                lambda driver: len(driver.find_elements(By.CLASS_NAME, JOB_CARD_CLASS))
                 >= 30
             )
             return True
         except TimeoutException:
             return False
 
+    def _record_first_card(self) -> None:
+        """Record the time from the homepage navigation to its first card.
+
+        The browser counts from the start of the navigation that loaded the
+        page, so the login redirect to the homepage is measured as well.
+        """
+        if self.time_to_first_card is None:
+            milliseconds = self._driver.execute_script("return performance.now()")
+            self.time_to_first_card = milliseconds / 1000
+
+    @recorded()
     def is_at_contact_info_page(self) -> bool:
         """Check if the ChromeDriver is at the contact info page."""
         try:
@@ -144,20 +255,23 @@ class ChromeDriver:
         except TimeoutException:
             return False
 
+    @recorded()
     def is_at_profile_page(self) -> bool:
         """Check if the ChromeDriver is at the profile page."""
         try:
             WebDriverWait(self._driver, self.timeout).until(
-                EC.url_contains("www.upwork.com/freelancers/~")
+                EC.url_contains(self.profile_url)
             )
             return True
         except TimeoutException:
             return False
 
+    @recorded()
     def get_page_source(self):
         """Get the page source of the current webpage."""
         return self._driver.page_source
 
+    @recorded()
     def is_element_present(self, element_content: str) -> bool:
         """Check if the element is present."""
         try:
@@ -168,6 +282,7 @@ class ChromeDriver:
         except TimeoutException:
             return False
 
+    @recorded()
     def is_element_present_by_xpath(self, element_content: str) -> bool:
         """Check if the element is present."""
         try:
@@ -178,13 +293,73 @@ class ChromeDriver:
         except TimeoutException:
             return False
 
+    @property
+    def current_url(self) -> str:
+        """Get the URL of the current webpage."""
+        return self._driver.current_url
+
+    @property
+    def pid(self) -> int:
+        """Get the process id of the chromedriver, the root of the browser."""
+        return self._driver.service.process.pid
+
+    def get_cookies(self) -> list[dict]:
+        """Get the cookies of the current webpage."""
+        return self._driver.get_cookies()
+
+    def add_cookies(self, cookies: list[dict]) -> None:
+        """Add the cookies to the current webpage."""
+        for cookie in cookies:
+            self._driver.add_cookie(cookie)
+
+    def kill(self) -> None:
+        """Kill the browser process tree without quitting, releasing the profile."""
+        try:
+            root = psutil.Process(self.pid)
+            processes = [root, *root.children(recursive=True)]
+        except psutil.NoSuchProcess:
+            processes = []
+        for process in processes:
+            try:
+                process.kill()
+            except psutil.NoSuchProcess:
+                pass
+        if self.profile is not None:
+            self.profile.release()
+
+    def close(self) -> None:
+        """Quit the browser, saving the recording and releasing the profile."""
+        self._driver.quit()
+        if self.profile is not None:
+            if self.time_to_first_card is not None:
+                self.profile.record_time_to_first_card(self.time_to_first_card)
+            self.profile.release()
+        if self.recording is not None:
+            self.recording.save(self.record_path)
+            logger.info(f"Recording saved to {self.record_path}.")
+
 
 class DriverManager:
     """Class to handle same Driver within scanning classes."""
 
-    def __init__(self, driver: ChromeDriver):
-        """Initialize the DriverManager with the specified ChromeDriver instance."""
+    def __init__(
+        self,
+        driver: Union[Browser, AsyncBrowser],
+        archive: Optional[PageArchive] = None,
+    ):
+        """Initialize the DriverManager with the specified Browser instance."""
         self.driver = driver
+        self.archive = archive
         self.username: str = os.getenv("USERNAME")
         self.password: str = os.getenv("PASSWORD")
         self.secret_answer: str = os.getenv("SECRET_ANSWER")
+
+    def _archive_page_source(self, page_type: str, page_source: str) -> None:
+        """Store the raw page source in the archive, if there is one."""
+        if self.archive is not None:
+            self.archive.add(
+                self.username,
+                page_type,
+                page_source,
+                url=getattr(self.driver, "current_url", None),
+            )
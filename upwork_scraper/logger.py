@@ -1,14 +1,107 @@
-"""Logger to be used within the package."""
+"""Logger to be used within the package.
 
+Records are only put on a queue by the calling thread, while a background
+listener formats and writes them, so logging stays off the scanners' hot
+path. ``LOG_FORMAT`` picks the output: ``rich`` for interactive use, the
+default on a terminal, or ``json`` for one compact JSON object per line
+with the run, account and stage set by ``log_context``.
+"""
+
+import atexit
+import contextvars
+import copy
+import json
 import logging
+import os
+import queue
+import sys
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterator, Optional
 
 from rich.logging import RichHandler
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(message)s",
-    datefmt="[%Y-%m-%d %H:%M:%S]",
-    handlers=[RichHandler(rich_tracebacks=True)],
-)
+CONTEXT_FIELDS: tuple[str, ...] = ("run", "account", "stage")
+
+_context: dict[str, contextvars.ContextVar] = {
+    field: contextvars.ContextVar(field, default=None) for field in CONTEXT_FIELDS
+}
+
+
+@contextmanager
+def log_context(**fields: str) -> Iterator[None]:
+    """Attach the run, account or stage to the records logged within."""
+    tokens = [
+        (_context[field], _context[field].set(value)) for field, value in fields.items()
+    ]
+    try:
+        yield
+    finally:
+        for variable, token in reversed(tokens):
+            variable.reset(token)
+
+
+class ContextQueueHandler(QueueHandler):
+    """A queue handler stamping the records with the caller's context."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge the message and context, keeping the traceback for rich."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        for field, variable in _context.items():
+            setattr(record, field, variable.get())
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """A formatter writing each record as one compact JSON object."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the record as a JSON line."""
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        for field in CONTEXT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, separators=(",", ":"))
+
+
+def create_output_handler(log_format: str) -> logging.Handler:
+    """Create the handler writing the records in the specified format."""
+    if log_format == "json":
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler = RichHandler(rich_tracebacks=True)
+        handler.setFormatter(
+            logging.Formatter("%(message)s", datefmt="[%Y-%m-%d %H:%M:%S]")
+        )
+    return handler
+
+
+def setup_logging(log_format: Optional[str] = None) -> QueueListener:
+    """Send the records of the root logger through a background listener."""
+    if log_format is None:
+        log_format = os.getenv("LOG_FORMAT") or (
+            "rich" if sys.stderr.isatty() else "json"
+        )
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(records, create_output_handler(log_format))
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.handlers = [ContextQueueHandler(records)]
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
 
+listener = setup_logging()
 logger = logging.getLogger(__name__)
@@ -1,30 +1,152 @@
 """Main module for the Argyle Upwork project."""
 
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Iterator, Optional
+
 from dotenv import load_dotenv
 
-from upwork_scraper.driver import ChromeDriver
+from upwork_scraper.archive import PageArchive
+from upwork_scraper.browser import Browser
+from upwork_scraper.browser_profile import CACHE_SIZE, BrowserProfile
+from upwork_scraper.driver import BASE_URL, ChromeDriver
 from upwork_scraper.homepage_scanner import HomepageScanner
-from upwork_scraper.logger import logger
+from upwork_scraper.logger import log_context, logger
 from upwork_scraper.login_manager import LoginHandler
 from upwork_scraper.profile_scanner import ProfileScanner
+from upwork_scraper.ranking import JobRanker
+from upwork_scraper.recording import Recording
+from upwork_scraper.replay import ReplayDriver
+from upwork_scraper.search import JobIndex
+from upwork_scraper.storage import DEFAULT_ACCOUNT, store_locally
+from upwork_scraper.watchdog import COMMAND_TIMEOUT, MAX_RSS, BrowserWatchdog
+
+
+def create_driver() -> Browser:
+    """Create the driver configured by the environment.
+
+    ``REPLAY_PATH`` replays a recorded session without a browser, against
+    the site it was recorded on, while ``RECORD_PATH`` records the live
+    session to that path. ``PROFILES_PATH`` keeps a persistent browser
+    profile per account under that directory, with a disk cache capped at
+    ``PROFILE_CACHE_SIZE`` bytes. ``UPWORK_URL``
+    points the driver to another site, such as the ``mock_site``. A live
+    browser runs under a ``BrowserWatchdog``, replacing it when a command
+    takes over ``BROWSER_COMMAND_TIMEOUT`` seconds or it grows over
+    ``BROWSER_MAX_RSS`` bytes, and exporting its metrics to ``METRICS_PATH``.
+    """
+    replay_path = os.getenv("REPLAY_PATH")
+    if replay_path:
+        return ReplayDriver(Recording.load(replay_path))
+    username = os.getenv("USERNAME")
+    profiles_path = os.getenv("PROFILES_PATH")
+    profile = (
+        BrowserProfile(
+            profiles_path,
+            username,
+            cache_size=int(os.getenv("PROFILE_CACHE_SIZE", CACHE_SIZE)),
+        )
+        if profiles_path
+        else None
+    )
+    return BrowserWatchdog(
+        lambda: ChromeDriver(
+            record_path=os.getenv("RECORD_PATH"),
+            profile=profile,
+            base_url=os.getenv("UPWORK_URL", BASE_URL),
+        ),
+        max_rss=int(os.getenv("BROWSER_MAX_RSS", MAX_RSS)),
+        command_timeout=float(os.getenv("BROWSER_COMMAND_TIMEOUT", COMMAND_TIMEOUT)),
+        metrics_path=os.getenv("METRICS_PATH"),
+        account=username or DEFAULT_ACCOUNT,
+    )
+
 
+@contextmanager
+def timed(timings: dict[str, float], stage: str) -> Iterator[None]:
+    """Record the seconds spent in the stage into the timings and logs."""
+    start = time.perf_counter()
+    try:
+        with log_context(stage=stage):
+            yield
+    finally:
+        timings[stage] = time.perf_counter() - start
 
-def handler():
-    """Run the main handler."""
+
+def handler(chrome_driver: Optional[Browser] = None) -> dict[str, float]:
+    """Run the main handler and return the seconds spent in each stage."""
     load_dotenv()
-    chrome_driver = ChromeDriver()
+    with log_context(run=uuid.uuid4().hex[:12], account=os.getenv("USERNAME")):
+        return run_stages(chrome_driver)
+
+
+def run_stages(chrome_driver: Optional[Browser] = None) -> dict[str, float]:
+    """Run the stages of the handler."""
+    if chrome_driver is None:
+        chrome_driver = create_driver()
+    archive_path = os.getenv("ARCHIVE_PATH")
+    archive_codec = os.getenv("ARCHIVE_CODEC")
+    archive = PageArchive(archive_path, archive_codec) if archive_path else None
+    index_path = os.getenv("INDEX_PATH")
+    job_index = JobIndex(index_path) if index_path else None
+    shortlist_days = os.getenv("SHORTLIST_DAYS")
+    posted_after = (
+        datetime.now() - timedelta(days=float(shortlist_days))
+        if shortlist_days
+        else None
+    )
+    timings: dict[str, float] = {}
+
+    try:
+        with timed(timings, "login"):
+            login_manager = LoginHandler(chrome_driver)
+            login_manager.login()
+        logger.info("Login successful.")
+
+        with timed(timings, "homepage"):
+            homepage_scanner = HomepageScanner(chrome_driver, archive)
+            homepage_scanner.scan_homepage()
+        logger.info("Homepage scanned successfully.")
 
-    login_manager = LoginHandler(chrome_driver)
-    login_manager.login()
-    logger.info("Login successful.")
+        if job_index is not None:
+            new_jobs = job_index.add(homepage_scanner.job_sections)
+            logger.info(f"Indexed {new_jobs} new job sections successfully.")
 
-    homepage_scanner = HomepageScanner(chrome_driver)
-    homepage_scanner.scan_homepage()
-    logger.info("Homepage scanned successfully.")
+        with timed(timings, "profile"):
+            profile_scanner = ProfileScanner(chrome_driver, archive)
+            profile_scanner.scan_profile()
+        logger.info("Profile scanned successfully.")
 
-    profile_scanner = ProfileScanner(chrome_driver)
-    profile_scanner.scan_profile()
-    logger.info("Profile scanned successfully.")
+        if job_index is not None:
+            with timed(timings, "ranking"):
+                shortlist = JobRanker(job_index).shortlist(
+                    profile_scanner.profile.profile_page, posted_after=posted_after
+                )
+                jobs = job_index.get_jobs(doc_id for doc_id, _ in shortlist)
+                store_locally(
+                    "shortlist",
+                    profile_scanner.datetime_now,
+                    [
+                        {**job, "score": score}
+                        for job, (_, score) in zip(jobs, shortlist)
+                    ],
+                )
+            logger.info("Jobs ranked successfully.")
+    finally:
+        chrome_driver.close()
+        if archive is not None:
+            stats = archive.stats()
+            logger.info(
+                f"Archive holds {stats.captures} captures, "
+                f"dedup ratio {stats.dedup_ratio:.1f}x, "
+                f"compression ratio {stats.compression_ratio:.1f}x."
+            )
+            archive.close()
+    return timings
 
 
-handler()
+if __name__ == "__main__":
+    handler()
@@ -0,0 +1,308 @@
+"""A local mock of the Upwork pages the scanners go through.
+
+It serves the login flow, the best-matches page, the contact info page and
+the profile page with the same ids and ``data-test`` attributes as Upwork,
+so the whole ``handler`` can run against it with ``UPWORK_URL`` set to its
+``base_url``. Latency and failures can be injected to load-test the scraper.
+"""
+
+import html
+import random
+import secrets
+import threading
+import time
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from typing import Optional, Type
+from urllib.parse import parse_qs
+
+from upwork_scraper.driver import (CONTACT_INFO_PATH, HOMEPAGE_PATH, LOGIN_PATH,
+                                   PROFILE_PATH)
+
+SESSION_COOKIE: str = "master_access_token"
+PROFILE_ID: str = "01f2c3d4e5a6b7c8d9"
+
+NAVIGATION = """
+<nav>
+    <span id="nav-notifications-label">Notifications</span>
+</nav>
+"""
+
+JOB_CARD = """
+<section class="up-card-section up-card-list-section up-card-hover">
+    <a class="up-n-link" href="/jobs/Python-scraper_~0{index}/">Python scraper {index}</a>
+    <span data-test="job-description-text">  Build a   web scraper in Python.  </span>
+    <strong data-test="proposals">5 to 10</strong>
+    <span data-test="posted-on">2 hours ago</span>
+    <small data-test="client-country">United States</small>
+    <span data-test="budget">$500</span>
+    <strong data-test="job-type">Fixed-price</strong>
+    <span data-test="contractor-tier">Intermediate</span>
+    <span data-test="formatted-amount">$10K+</span>
+    <a class="up-skill-badge text-muted">Python</a>
+    <a class="up-skill-badge text-muted">Selenium</a>
+    <div class="up-icon text-complimentary"></div>
+</section>
+"""
+
+CONTACT_INFO_SECTIONS = """
+    <div data-test="userId">1941e405</div>
+    <div data-test="userName">Dave   Worker</div>
+    <div data-test="userEmail">r******sk@argyle.com</div>
+    <span data-test="addressStreet">Wilhelminastraat 128</span>
+    <span data-test="addressStreet2">12</span>
+    <span data-test="addressCity">Amsterdam</span>
+    <span data-test="addressState">NH,</span>
+    <span data-test="addressZip"></span>
+    <span data-test="addressCountry">Netherlands</span>
+    <div data-test="phone">+31 621 466 631</div>
+"""
+
+PROFILE_SECTIONS = """
+    <h2 class="mb-0 h4">Software engineer</h2>
+    <h3 class="my-6x h5">$70.00/hr</h3>
+    <div class="air3-line-clamp">Python developer building scrapers.</div>
+    <span class="air3-token">Python</span>
+    <span class="air3-token">Selenium</span>
+    <div>
+        <div><div><h3>Employment history</h3></div></div>
+        <div class="air3-card-section px-0">
+            <h4 class="my-0">Software Engineer | Argyle</h4>
+            <div class="mt-3x text-light-on-inverse">January 2020 -  Present</div>
+        </div>
+    </div>
+"""
+
+LOGIN_STEPS: dict[str, tuple[str, str]] = {
+    "username": ("login_username", "login_password_continue"),
+    "password": ("login_password", "login_control_continue"),
+    "answer": ("login_answer", "login_control_continue"),
+}
+
+
+def homepage(cards: int = 30) -> str:
+    """Build a best-matches page with the specified number of job cards."""
+    sections = "".join(JOB_CARD.format(index=index) for index in range(cards))
+    return f"<html><body>{NAVIGATION}{sections}</body></html>"
+
+
+def contact_info_page() -> str:
+    """Build the contact info page, linking to the profile page."""
+    return (
+        f"<html><body>{NAVIGATION}"
+        '<div data-test="settings-nav">'
+        f'<a href="{PROFILE_PATH}{PROFILE_ID}">View profile</a>'
+        f"</div>{CONTACT_INFO_SECTIONS}</body></html>"
+    )
+
+
+def profile_page() -> str:
+    """Build the profile page."""
+    return f"<html><body>{NAVIGATION}{PROFILE_SECTIONS}</body></html>"
+
+
+def login_page(step: str, username: str = "") -> str:
+    """Build the login form of the specified step."""
+    input_id, button_id = LOGIN_STEPS[step]
+    input_type = "text" if step == "username" else "password"
+    return (
+        f'<html><body><form method="post" action="{LOGIN_PATH}">'
+        f'<input type="hidden" name="step" value="{step}">'
+        f'<input type="hidden" name="username" value="{html.escape(username)}">'
+        f'<input type="{input_type}" id="{input_id}" name="value">'
+        f'<button type="submit" id="{button_id}">Continue</button>'
+        "</form></body></html>"
+    )
+
+
+class MockUpworkSite:
+    """A threaded HTTP server mocking Upwork on a local port.
+
+    Every response is delayed by ``latency`` seconds plus up to ``jitter``
+    seconds, and a ``failure_rate`` share of the requests fail with a 503.
+    """
+
+    def __init__(
+        self,
+        cards: int = 50,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        username: str = "worker@example.com",
+        password: str = "password",
+        secret_answer: Optional[str] = None,
+        seed: Optional[int] = None,
+    ):
+        """Initialize the MockUpworkSite with the specified configuration.
+
+        If ``secret_answer`` is given, the login asks for it after the
+        password, like Upwork does on an unknown device.
+        """
+        self.cards = cards
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.username = username
+        self.password = password
+        self.secret_answer = secret_answer
+        self.requests: int = 0
+        self.failures: int = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._sessions: set[str] = set()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def base_url(self) -> str:
+        """Get the URL the site is served at."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockUpworkSite":
+        """Serve the site from a background thread on a free port."""
+        handler = type("MockUpworkHandler", (MockUpworkHandler,), {"site": self})
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving the site."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockUpworkSite":
+        """Start the site."""
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Stop the site."""
+        self.stop()
+
+    def delay(self) -> float:
+        """Draw the delay of the next response."""
+        with self._lock:
+            return self.latency + self._random.uniform(0, self.jitter)
+
+    def should_fail(self) -> bool:
+        """Count the request and draw whether it fails."""
+        with self._lock:
+            self.requests += 1
+            failed = self._random.random() < self.failure_rate
+            self.failures += failed
+            return failed
+
+    def open_session(self) -> str:
+        """Open a logged in session and get its token."""
+        token = secrets.token_hex(16)
+        with self._lock:
+            self._sessions.add(token)
+        return token
+
+    def is_session(self, token: Optional[str]) -> bool:
+        """Check if the token belongs to a logged in session."""
+        with self._lock:
+            return token in self._sessions
+
+
+class MockUpworkHandler(BaseHTTPRequestHandler):
+    """A request handler serving the pages of its ``site``."""
+
+    site: MockUpworkSite
+
+    def log_message(self, format: str, *args) -> None:
+        """Keep the requests out of the output."""
+
+    def do_GET(self) -> None:
+        """Serve the page at the requested path."""
+        if self._delay_or_fail():
+            return
+        path = self.path.split("?")[0]
+        logged = self.site.is_session(self._session_token())
+        if path == LOGIN_PATH:
+            if logged:
+                self._redirect(HOMEPAGE_PATH)
+            else:
+                self._send_page(login_page("username"))
+        elif path in (HOMEPAGE_PATH, CONTACT_INFO_PATH) or path.startswith(
+            PROFILE_PATH
+        ):
+            if not logged:
+                self._redirect(LOGIN_PATH)
+            elif path == HOMEPAGE_PATH:
+                self._send_page(homepage(self.site.cards))
+            elif path == CONTACT_INFO_PATH:
+                self._send_page(contact_info_page())
+            else:
+                self._send_page(profile_page())
+        else:
+            self.send_error(HTTPStatus.NOT_FOUND)
+
+    def do_POST(self) -> None:
+        """Go through the submitted step of the login."""
+        if self._delay_or_fail():
+            return
+        if self.path.split("?")[0] != LOGIN_PATH:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        form = parse_qs(self.rfile.read(length).decode())
+        step = form.get("step", [""])[0]
+        username = form.get("username", [""])[0]
+        value = form.get("value", [""])[0]
+
+        if step == "username" and value == self.site.username:
+            self._send_page(login_page("password", value))
+        elif step == "password" and value == self.site.password:
+            if self.site.secret_answer is None:
+                self._log_in()
+            else:
+                self._send_page(login_page("answer", username))
+        elif step == "answer" and value == self.site.secret_answer:
+            self._log_in()
+        else:
+            self._send_page(login_page("username"))
+
+    def _delay_or_fail(self) -> bool:
+        """Delay the response, then fail it if the site says so."""
+        time.sleep(self.site.delay())
+        if self.site.should_fail():
+            self.send_error(HTTPStatus.SERVICE_UNAVAILABLE)
+            return True
+        return False
+
+    def _session_token(self) -> Optional[str]:
+        """Get the session token from the request cookies."""
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        morsel = cookie.get(SESSION_COOKIE)
+        return morsel.value if morsel else None
+
+    def _log_in(self) -> None:
+        """Open a session and redirect to the homepage."""
+        token = self.site.open_session()
+        self._redirect(HOMEPAGE_PATH, f"{SESSION_COOKIE}={token}; Path=/")
+
+    def _redirect(self, path: str, cookie: Optional[str] = None) -> None:
+        """Redirect to the specified path."""
+        self.send_response(HTTPStatus.FOUND)
+        self.send_header("Location", path)
+        if cookie is not None:
+            self.send_header("Set-Cookie", cookie)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _send_page(self, page: str) -> None:
+        """Send the specified page."""
+        body = page.encode()
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
@@ -4,7 +4,7 @@ import re
 from datetime import datetime, timedelta
 from typing import Optional, Union
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ValidationInfo, field_validator
 
 
 def clean_numeric_string(value: Union[str, None]) -> Optional[str]:
@@ -32,8 +32,10 @@ def validate_client_spendings(value: Union[str, None]) -> Union[str, None]:
     return value
 
 
-def validate_posted_on(value: Union[str, None]) -> Union[str, None]:
-    """Validate the posted_on field."""
+def validate_posted_on(
+    value: Union[str, None], now: Optional[datetime] = None
+) -> Union[str, None]:
+    """Validate the posted_on field, relative to ``now`` if given."""
     if isinstance(value, str):
         time_units = {
             "days": "days",
@@ -47,8 +49,9 @@ def validate_posted_on(value: Union[str, None]) -> Union[str, None]:
         if match and match.groups()[1] in time_units:
             unit = time_units[match.groups()[1]]
             if unit in ("days", "minutes", "hours"):
+                now = now or datetime.now()
                 return (
-                    datetime.now() - timedelta(**{unit: int(match.groups()[0])})
+                    now - timedelta(**{unit: int(match.groups()[0])})
                 ).isoformat()
     return value
 
@@ -81,9 +84,9 @@ class JobSection(BaseModel):
         return clean_numeric_string(v)
 
     @field_validator("posted_on")
-    def validate_posted_on(cls, v):
+    def validate_posted_on(cls, v, info: ValidationInfo):
         """Validate the posted_on field."""
-        return validate_posted_on(v)
+        return validate_posted_on(v, (info.context or {}).get("now"))
 
     @field_validator("description")
     def strip_whitespace(cls, value):
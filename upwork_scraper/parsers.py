@@ -0,0 +1,167 @@
+"""A module with pure functions parsing Upwork pages into models."""
+
+import re
+from datetime import datetime
+from typing import Optional, Union
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+from upwork_scraper.models.job import JobSection
+from upwork_scraper.models.profile import AccountSection, LocationSection, ProfilePage
+
+
+def get_text_or_none(element) -> Optional[str]:
+    """Return the text if it exists, else return None."""
+    return element.text.strip() if element else None
+
+
+def get_page_soup(page_source: str) -> BeautifulSoup:
+    """Get the soup object of the page source."""
+    return BeautifulSoup(page_source, "html.parser")
+
+
+def find_job_sections(page_soup: BeautifulSoup) -> list:
+    """Find the job sections of the homepage."""
+    return page_soup.find_all(
+        "section",
+        class_="up-card-section up-card-list-section up-card-hover",
+    )
+
+
+def parse_job_section(section: Tag, now: Optional[datetime] = None) -> JobSection:
+    """Parse a job section.
+
+    ``now`` is the time the page was captured, which relative dates such as
+    "2 hours ago" are resolved against. It defaults to the current time.
+    """
+    # fmt: off
+    data: dict = {}
+    data["title"] = get_text_or_none(section.find("a", class_="up-n-link"))
+    data["description"] = get_text_or_none(section.find("span", {"data-test": "job-description-text"}))
+    data["proposals"] = get_text_or_none(section.find("strong", {"data-test": "proposals"}))
+    data["posted_on"] = get_text_or_none(section.find("span", {"data-test": "posted-on"}))
+    data["country"] = get_text_or_none(section.find("small", {"data-test": "client-country"}))
+    data["budget"] = get_text_or_none(section.find("span", {"data-test": "budget"}))
+    data["job_type"] = get_text_or_none(section.find("strong", {"data-test": "job-type"}))
+    data["duration"] = get_text_or_none(section.find("span", {"data-test": "duration"}))
+    data["experience"] = get_text_or_none(section.find("span", {"data-test": "contractor-tier"}))
+    data["client_spendings"] = get_text_or_none(section.find("span", {"data-test": "formatted-amount"}))
+    data["skills"] = [skill.text for skill in section.find_all("a", class_="up-skill-badge text-muted")]
+    data["payment_verified"] = bool(section.find("div", class_="up-icon text-complimentary"))
+    data["suffix_link"] = section.find("a", class_="up-n-link").get("href")
+    # fmt: on
+    return JobSection.model_validate(data, context={"now": now})
+
+
+def extract_account_fields(page_soup: BeautifulSoup) -> dict:
+    """Extract the raw fields of the account section of the contact info page."""
+    data: dict = {}
+    # fmt: off
+    data["id"] = get_text_or_none(page_soup.find("div", {"data-test": "userId"}))
+    data["full_name"] = get_text_or_none(page_soup.find("div", {"data-test": "userName"}))
+    data["masked_email"] = get_text_or_none(page_soup.find("div", {"data-test": "userEmail"}))
+    # fmt: on
+    return data
+
+
+def parse_account_section(page_soup: BeautifulSoup) -> AccountSection:
+    """Parse the account section of the contact info page."""
+    return AccountSection(**extract_account_fields(page_soup))
+
+
+def extract_location_fields(page_soup: BeautifulSoup) -> dict:
+    """Extract the raw fields of the location section of the contact info page."""
+    data: dict = {}
+    # fmt: off
+    data["line_1"] = get_text_or_none(page_soup.find("span", {"data-test": "addressStreet"}))
+    data["line_2"] = get_text_or_none(page_soup.find("span", {"data-test": "addressStreet2"}))
+    data["city"] = get_text_or_none(page_soup.find("span", {"data-test": "addressCity"}))
+    data["state"] = get_text_or_none(page_soup.find("span", {"data-test": "addressState"}))
+    data["postal_code"] = get_text_or_none(page_soup.find("span", {"data-test": "addressZip"}))
+    data["country"] = get_text_or_none(page_soup.find("span", {"data-test": "addressCountry"}))
+    data["phone_number"] = get_text_or_none(page_soup.find("div", {"data-test": "phone"}))
+    # fmt: on
+    return data
+
+
+def parse_location_section(page_soup: BeautifulSoup) -> LocationSection:
+    """Parse the location section of the contact info page."""
+    return LocationSection(**extract_location_fields(page_soup))
+
+
+def extract_profile_fields(page_soup: BeautifulSoup) -> dict:
+    """Extract the raw fields of the profile section of the profile page."""
+    data: dict = {}
+    # fmt: off
+    data["job_title"] = get_text_or_none(page_soup.find("h2", {'class': ['mb-0', 'h4']}))
+    data["hourly_rate"] = get_text_or_none(page_soup.find("h3", {'class': ['my-6x', 'h5']}))
+    data["description"] = get_text_or_none(page_soup.find("div", class_="air3-line-clamp"))
+    data["skills"] = [skill.text for skill in page_soup.find_all("span", class_="air3-token")]
+    data["employment_history"] = extract_employment_history(page_soup)
+    # fmt: on
+    return data
+
+
+def parse_profile_section(page_soup: BeautifulSoup) -> ProfilePage:
+    """Parse the profile section of the profile page."""
+    return ProfilePage(**extract_profile_fields(page_soup))
+
+
+def extract_employment_history(page_soup: BeautifulSoup) -> list:
+    """Extract the employment history from the profile page."""
+    employment_history_section: Optional[
+        Union[Tag, NavigableString]
+    ] = page_soup.find("h3", string=re.compile(r"\s*Employment history\s*"))
+    if employment_history_section is None:
+        return []
+    employment_history_list = []
+    if isinstance(employment_history_section, Tag):
+        employment_history_div = (
+            employment_history_section.find_previous("div")
+            .find_previous("div")
+            .find_previous("div")
+        )
+    if isinstance(employment_history_div, Tag):
+        employment_sections = employment_history_div.find_all(
+            "div", class_="air3-card-section px-0"
+        )
+        for entry in employment_sections:
+            title = get_text_or_none(entry.find("h4", class_="my-0"))
+            period = get_text_or_none(
+                entry.find("div", class_="mt-3x text-light-on-inverse")
+            )
+            employment_entry = {"title": title, "period": period}
+            employment_history_list.append(employment_entry)
+    return employment_history_list
+
+
+def parse_homepage(
+    page_source: str, now: Optional[datetime] = None
+) -> list[JobSection]:
+    """Parse the job sections of the homepage."""
+    page_soup = get_page_soup(page_source)
+    return [parse_job_section(section, now) for section in find_job_sections(page_soup)]
+
+
+def parse_contact_info_page(
+    page_source: str,
+) -> tuple[AccountSection, LocationSection]:
+    """Parse the account and location sections of the contact info page."""
+    page_soup = get_page_soup(page_source)
+    return parse_account_section(page_soup), parse_location_section(page_soup)
+
+
+def parse_profile_page(page_source: str) -> ProfilePage:
+    """Parse the profile section of the profile page."""
+    return parse_profile_section(get_page_soup(page_source))
+
+
+def extract_contact_info_fields(page_source: str) -> tuple[dict, dict]:
+    """Extract the raw fields of the account and location sections."""
+    page_soup = get_page_soup(page_source)
+    return extract_account_fields(page_soup), extract_location_fields(page_soup)
+
+
+def extract_profile_page_fields(page_source: str) -> dict:
+    """Extract the raw fields of the profile section of the profile page."""
+    return extract_profile_fields(get_page_soup(page_source))
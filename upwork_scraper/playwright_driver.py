@@ -0,0 +1,202 @@
+"""A module for driving Chrome asynchronously through Playwright."""
+
+from types import TracebackType
+from typing import Optional, Type
+
+from playwright.async_api import Browser as PlaywrightChromium
+from playwright.async_api import BrowserContext, Page, Playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright
+
+from upwork_scraper.browser import AsyncBrowser, AsyncBrowserSession
+from upwork_scraper.driver import (BASE_URL, CONTACT_INFO_PATH, HOMEPAGE_PATH,
+                                   JOB_CARD_CLASS, LOGIN_PATH, PROFILE_PATH)
+
+USER_AGENT: str = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 "
+    "Safari/537.36"
+)
+
+
+def by_id(element_content: str) -> str:
+    """Get the selector of the element with the specified id."""
+    return f'[id="{element_content}"]'
+
+
+class PlaywrightDriver(AsyncBrowser):
+    """A page of Chrome driven over the DevTools Protocol by Playwright.
+
+    Waits are driven by the browser's own events instead of polling the
+    driver, and many pages can be driven at once from one event loop.
+    """
+
+    def __init__(self, page: Page, base_url: str = BASE_URL):
+        """Initialize the PlaywrightDriver with the specified page."""
+        self.timeout: int = 10
+        self.timeout_for_checking_presence: int = 3
+        self.login_url: str = base_url + LOGIN_PATH
+        self.homepage_url: str = base_url + HOMEPAGE_PATH
+        self.contact_info_url: str = base_url + CONTACT_INFO_PATH
+        self.profile_url: str = base_url + PROFILE_PATH
+        self._page = page
+
+    async def go_to_url(self, url: str) -> None:
+        """Navigate the page to the specified URL."""
+        await self._page.goto(url)
+
+    async def enter_text_when_loaded(self, element_content: str, text: str) -> None:
+        """Enter text after element is loaded."""
+        await self._page.fill(
+            by_id(element_content), text, timeout=self.timeout * 1000
+        )
+
+    async def click_element(self, element_content: str) -> None:
+        """Click the specified element."""
+        await self._page.click(by_id(element_content), timeout=self.timeout * 1000)
+
+    async def get_profile_link(self, pattern: str) -> str:
+        """Get the link containing the specified pattern."""
+        element = await self._page.wait_for_selector(
+            f'xpath=//a[contains(@href, "{pattern}")]',
+            state="attached",
+            timeout=self.timeout * 1000,
+        )
+        return await element.evaluate("element => element.href")
+
+    async def _wait_for_selector(self, selector: str, timeout: int) -> bool:
+        """Wait until the selector is attached, False if it times out."""
+        try:
+            await self._page.wait_for_selector(
+                selector, state="attached", timeout=timeout * 1000
+            )
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    async def is_logged(self) -> bool:
+        """Check if the user is logged in."""
+        return await self._wait_for_selector(
+            by_id("nav-notifications-label"), self.timeout
+        )
+
+    async def is_at_login_page(self) -> bool:
+        """Check if the page is the login page, not logged in yet."""
+        await self._wait_for_selector(
+            f"{by_id('login_username')}, {by_id('nav-notifications-label')}",
+            self.timeout,
+        )
+        return await self._page.query_selector(by_id("login_username")) is not None
+
+    async def is_at_homepage(self) -> bool:
+        """Check if the page is the homepage with its job cards loaded."""
+        try:
+            await self._page.wait_for_url(
+                self.homepage_url, timeout=self.timeout * 1000
+            )
+            await self._page.wait_for_function(
+                "selector => document.querySelectorAll(selector).length >= 30",
+                arg=f".{JOB_CARD_CLASS}",
+                timeout=self.timeout * 1000,
+            )
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    async def is_at_contact_info_page(self) -> bool:
+        """Check if the page is the contact info page."""
+        try:
+            await self._page.wait_for_url(
+                self.contact_info_url, timeout=self.timeout * 1000
+            )
+        except PlaywrightTimeoutError:
+            return False
+        return await self._wait_for_selector("[data-test='settings-nav']", self.timeout)
+
+    async def is_at_profile_page(self) -> bool:
+        """Check if the page is the profile page."""
+        try:
+            await self._page.wait_for_url(
+                lambda url: self.profile_url in url,
+                timeout=self.timeout * 1000,
+            )
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    async def get_page_source(self) -> str:
+        """Get the page source of the current webpage."""
+        return await self._page.content()
+
+    async def is_element_present(self, element_content: str) -> bool:
+        """Check if the element is present."""
+        return await self._wait_for_selector(
+            by_id(element_content), self.timeout_for_checking_presence
+        )
+
+    async def is_element_present_by_xpath(self, element_content: str) -> bool:
+        """Check if the element is present."""
+        return await self._wait_for_selector(f"xpath={element_content}", self.timeout)
+
+    @property
+    def current_url(self) -> str:
+        """Get the URL of the current webpage."""
+        return self._page.url
+
+    async def close(self) -> None:
+        """Close the page."""
+        await self._page.close()
+
+
+class PlaywrightSession(AsyncBrowserSession):
+    """A browser context whose pages share the login cookies."""
+
+    def __init__(self, context: BrowserContext, base_url: str = BASE_URL):
+        """Initialize the PlaywrightSession with the specified context."""
+        self._context = context
+        self.base_url = base_url
+
+    async def new_page(self) -> PlaywrightDriver:
+        """Open a new page in the session."""
+        return PlaywrightDriver(await self._context.new_page(), self.base_url)
+
+    async def close(self) -> None:
+        """Close the session and its pages."""
+        await self._context.close()
+
+
+class PlaywrightBrowser:
+    """An async context manager running one Chrome for many sessions."""
+
+    def __init__(self, headless: bool = True, base_url: str = BASE_URL):
+        """Initialize the PlaywrightBrowser with the specified configuration."""
+        self.headless = headless
+        self.base_url = base_url
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[PlaywrightChromium] = None
+
+    async def __aenter__(self) -> "PlaywrightBrowser":
+        """Launch Chrome."""
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(
+            headless=self.headless,
+            args=["--no-sandbox", "--disable-gpu", "--disable-dev-shm-usage"],
+        )
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close Chrome."""
+        await self._browser.close()
+        await self._playwright.stop()
+
+    async def new_session(self) -> PlaywrightSession:
+        """Open a new session with its own cookies."""
+        context = await self._browser.new_context(
+            user_agent=USER_AGENT, viewport={"width": 1920, "height": 1080}
+        )
+        return PlaywrightSession(context, self.base_url)
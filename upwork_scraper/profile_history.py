@@ -0,0 +1,127 @@
+"""A module keeping the history of a profile as field-level changes.
+
+The contact info, location and profile sections rarely change between
+scans, so instead of a full snapshot per scan, the raw fields extracted
+from each section are hashed and compared with the last stored ones. An
+unchanged section is neither validated nor written, and a changed one
+only stores the fields whose validated value changed. Replaying the
+changes rebuilds the full ``Profile`` at any point in time.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional, Type, Union
+
+from pydantic import BaseModel
+
+from upwork_scraper.models.profile import (AccountSection, LocationSection,
+                                          Profile, ProfilePage)
+from upwork_scraper.storage import DATA_DIR
+
+HISTORY_DIR: Path = Path(DATA_DIR, "profile-history")
+SECTION_MODELS: dict[str, Type[BaseModel]] = {
+    "account_session": AccountSection,
+    "location_session": LocationSection,
+    "profile_page": ProfilePage,
+}
+
+
+class SectionChange(BaseModel):
+    """The fields of a profile section that changed at a scan."""
+
+    captured_at: datetime
+    section: str
+    fields_hash: str
+    changes: dict[str, Any]
+
+
+def hash_fields(fields: dict) -> str:
+    """Hash the raw fields of a section."""
+    serialized = json.dumps(fields, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(serialized.encode()).hexdigest()
+
+
+class ProfileHistory:
+    """The changes of the profile of an account, stored as JSON lines."""
+
+    def __init__(self, account: str, directory: Union[str, Path] = HISTORY_DIR):
+        """Initialize the ProfileHistory, loading the stored changes."""
+        self.path = Path(directory, f"{account}.jsonl")
+        self.changes: list[SectionChange] = []
+        self._hashes: dict[str, str] = {}
+        self._values: dict[str, dict] = {section: {} for section in SECTION_MODELS}
+        if self.path.exists():
+            with self.path.open() as file:
+                for line in file:
+                    self._apply(SectionChange(**json.loads(line)))
+
+    def __len__(self) -> int:
+        """Get the number of stored changes."""
+        return len(self.changes)
+
+    def update(
+        self, sections: dict[str, dict], captured_at: Optional[datetime] = None
+    ) -> list[str]:
+        """Store the changes of the raw section fields and get the changed ones.
+
+        Sections whose raw fields hash the same as the last stored ones are
+        skipped without validating them.
+        """
+        captured_at = captured_at or datetime.now()
+        # Validate every changed section before applying any of them, so a
+        # section failing validation leaves the history as it was.
+        validated = []
+        for section, fields in sections.items():
+            fields_hash = hash_fields(fields)
+            if self._hashes.get(section) != fields_hash:
+                values = SECTION_MODELS[section](**fields).dict()
+                validated.append((section, fields_hash, values))
+
+        new_changes = []
+        for section, fields_hash, values in validated:
+            previous = self._values[section]
+            change = SectionChange(
+                captured_at=captured_at,
+                section=section,
+                fields_hash=fields_hash,
+                changes={
+                    name: value
+                    for name, value in values.items()
+                    if name not in previous or previous[name] != value
+                },
+            )
+            self._apply(change)
+            new_changes.append(change)
+
+        if new_changes:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a") as file:
+                for change in new_changes:
+                    file.write(change.model_dump_json() + "\n")
+        return [change.section for change in new_changes]
+
+    def profile_at(self, at: Optional[datetime] = None) -> Optional[Profile]:
+        """Rebuild the profile as it was at the time, None if not scanned yet."""
+        values: dict[str, dict] = {section: {} for section in SECTION_MODELS}
+        for change in self.changes:
+            if at is not None and change.captured_at > at:
+                break
+            values[change.section].update(change.changes)
+        if not all(values.values()):
+            return None
+        # The values were validated when stored, validating them again would
+        # not be idempotent, e.g. for the country code.
+        return Profile.model_construct(
+            **{
+                section: model.model_construct(**values[section])
+                for section, model in SECTION_MODELS.items()
+            }
+        )
+
+    def _apply(self, change: SectionChange) -> None:
+        """Apply the change to the latest values."""
+        self.changes.append(change)
+        self._hashes[change.section] = change.fields_hash
+        self._values[change.section].update(change.changes)
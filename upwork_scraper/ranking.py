@@ -0,0 +1,114 @@
+"""A module for ranking scanned jobs by relevance to the profile."""
+
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from upwork_scraper.models.profile import ProfilePage
+from upwork_scraper.search import JobIndex, make_terms
+
+# Skills matching the profile count more than matching description terms.
+SKILL_WEIGHT: float = 3.0
+
+
+def profile_terms(profile_page: ProfilePage) -> dict[str, float]:
+    """Get the weighted index terms of a profile page."""
+    weights: dict[str, float] = {}
+    for text in (profile_page.job_title, profile_page.description):
+        if text:
+            weights.update(dict.fromkeys(make_terms("term", text), 1.0))
+    for skill in profile_page.skills or []:
+        weights.update(dict.fromkeys(make_terms("skill", skill), SKILL_WEIGHT))
+    return weights
+
+
+class JobRanker:
+    """A class scoring the jobs of an index against a profile.
+
+    Jobs are represented as rows of a sparse binary job-term matrix built
+    straight from the index postings, weighted by TF-IDF, so scoring every
+    job is a single sparse matrix-vector product.
+    """
+
+    def __init__(self, index: JobIndex):
+        """Initialize the JobRanker with the job-term matrix of the index."""
+        self.index = index
+        self.vocabulary: dict[str, int] = {}
+        rows, columns = [], []
+        for segment in index.segments:
+            term_ids = np.array(
+                [
+                    self.vocabulary.setdefault(term, len(self.vocabulary))
+                    for term in segment.terms
+                ],
+                dtype=np.int64,
+            )
+            rows.append(segment.postings)
+            columns.append(np.repeat(term_ids, np.diff(segment.offsets)))
+
+        rows_array = np.concatenate([np.empty(0, dtype=np.uint32)] + rows)
+        columns_array = np.concatenate([np.empty(0, dtype=np.int64)] + columns)
+        self.matrix = csr_matrix(
+            (np.ones(len(rows_array), dtype=np.float32), (rows_array, columns_array)),
+            shape=(len(index), len(self.vocabulary)),
+        )
+        document_frequency = np.bincount(columns_array, minlength=len(self.vocabulary))
+        self.idf = (
+            np.log((1 + len(index)) / (1 + document_frequency)) + 1
+        ).astype(np.float32)
+        self.norms = np.sqrt(self.matrix @ (self.idf**2))
+
+    def score(self, weights: dict[str, float]) -> np.ndarray:
+        """Get the cosine similarity of every job to the weighted terms."""
+        query = np.zeros(len(self.vocabulary), dtype=np.float32)
+        for term, weight in weights.items():
+            term_id = self.vocabulary.get(term)
+            if term_id is not None:
+                query[term_id] = weight
+        query *= self.idf
+        query_norm = np.linalg.norm(query)
+        if not query_norm:
+            return np.zeros(len(self.index), dtype=np.float32)
+        dot = self.matrix @ (query * self.idf)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = dot / (self.norms * query_norm)
+        return np.nan_to_num(scores)
+
+    def shortlist(
+        self,
+        profile_page: ProfilePage,
+        limit: int = 50,
+        posted_after: Optional[datetime] = None,
+    ) -> list[tuple[int, float]]:
+        """Get the doc ids and scores of the best matching jobs, best first.
+
+        Jobs sharing a suffix link are listed once, and ``posted_after``
+        only keeps the jobs posted since then.
+        """
+        scores = self.score(profile_terms(profile_page))
+        doc_ids = (
+            np.sort(self.index.search(posted_on=(posted_after, None)))
+            if posted_after is not None
+            else np.arange(len(scores))
+        )
+        # Jobs sharing a link are dropped, so more candidates are taken until
+        # the shortlist is full or every job is a candidate.
+        candidates = min(limit, len(doc_ids))
+        shortlist: list[tuple[int, float]] = []
+        while candidates:
+            best = doc_ids[np.argpartition(-scores[doc_ids], candidates - 1)]
+            best = best[:candidates]
+            best = best[np.argsort(-scores[best], kind="stable")]
+            shortlist, links = [], set()
+            for doc_id in best:
+                link = self.index.links[doc_id]
+                if link and link in links:
+                    continue
+                links.add(link)
+                shortlist.append((int(doc_id), float(scores[doc_id])))
+            if len(shortlist) >= limit or candidates == len(doc_ids):
+                break
+            candidates = min(2 * candidates, len(doc_ids))
+        return shortlist[:limit]
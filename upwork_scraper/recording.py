@@ -0,0 +1,78 @@
+"""A module for storing recorded driver sessions."""
+
+import gzip
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
+
+
+class Recording:
+    """A compact archive of the calls made to a driver and their results.
+
+    Page sources are stored once per distinct content and referenced by their
+    hash, so polling the same page repeatedly does not grow the archive. The
+    base URL of the recorded site is kept, so a session recorded against
+    another site than Upwork, such as the ``mock_site``, replays its URLs.
+    """
+
+    def __init__(
+        self,
+        calls: Optional[list[dict]] = None,
+        pages: Optional[dict[str, dict]] = None,
+        base_url: Optional[str] = None,
+    ):
+        """Initialize the Recording with the recorded calls and pages."""
+        self.calls: list[dict] = calls or []
+        self.pages: dict[str, dict] = pages or {}
+        self.base_url = base_url
+
+    def add_call(
+        self,
+        method: str,
+        args: Iterable,
+        result: Any,
+        url: str,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Add a driver call, storing page sources in the pages table.
+
+        A call that raised is stored with the type and message of its
+        ``error``, so a replay raises it again.
+        """
+        if method == "get_page_source" and error is None:
+            result = {"page": self.add_page(url, result)}
+        call = {"method": method, "args": list(args), "result": result, "url": url}
+        if error is not None:
+            call["error"] = {
+                "type": type(error).__name__,
+                "message": getattr(error, "msg", None) or str(error),
+            }
+        self.calls.append(call)
+
+    def add_page(self, url: str, source: str) -> str:
+        """Add a page source and return the key it is stored under."""
+        key = hashlib.sha1(source.encode()).hexdigest()
+        self.pages.setdefault(key, {"url": url, "source": source})
+        return key
+
+    def get_page(self, key: str) -> str:
+        """Get the page source stored under the specified key."""
+        return self.pages[key]["source"]
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Save the recording as a gzip compressed json file."""
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            json.dump(
+                {"calls": self.calls, "pages": self.pages, "base_url": self.base_url},
+                file,
+            )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "Recording":
+        """Load a recording saved with ``save``."""
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            data = json.load(file)
+        return cls(
+            calls=data["calls"], pages=data["pages"], base_url=data.get("base_url")
+        )
@@ -0,0 +1,162 @@
+"""A module for re-parsing archived pages in parallel."""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+from pydantic import BaseModel
+
+from upwork_scraper.archive import Capture, PageArchive
+from upwork_scraper.logger import logger
+from upwork_scraper.models.job import JobSection
+from upwork_scraper.parsers import (extract_contact_info_fields,
+                                    extract_profile_page_fields,
+                                    parse_homepage)
+from upwork_scraper.profile_history import ProfileHistory
+from upwork_scraper.storage import DATA_DIR, DEFAULT_ACCOUNT, store_locally
+
+# Captures sent to the pool at a time, which bounds the results held in memory.
+BATCH_SIZE: int = 256
+REPARSE_DIR: Path = Path(DATA_DIR, "reparsed")
+
+_archive: Optional[PageArchive] = None
+
+
+class ReparseStats(BaseModel):
+    """A Pydantic BaseModel representing the outcome of a re-parse."""
+
+    pages: int
+    failures: int
+    seconds: float
+
+    @property
+    def pages_per_second(self) -> float:
+        """Return the number of pages parsed per second."""
+        return self.pages / self.seconds if self.seconds else 0.0
+
+
+def _open_archive(archive_path: str) -> None:
+    """Open the archive once in each worker process."""
+    global _archive
+    _archive = PageArchive(archive_path)
+
+
+def reparse_capture(
+    capture: Capture,
+) -> Union[list[JobSection], tuple[dict, dict], dict, str]:
+    """Parse a captured page into what is stored for its page type.
+
+    Homepages are parsed into job sections, while contact info and profile
+    pages give the raw fields of their sections, validated when they are
+    stored in the profile history. Reading and parsing errors are returned
+    as a string, so one broken page does not stop the whole run.
+    """
+    try:
+        page_source = _archive.get(capture)
+        if capture.page_type == "homepage":
+            return parse_homepage(page_source, capture.captured_at)
+        if capture.page_type == "contactinfo":
+            return extract_contact_info_fields(page_source)
+        return extract_profile_page_fields(page_source)
+    except Exception as error:
+        return f"{type(error).__name__}: {error}"
+
+
+def _batches(captures: Iterable[Capture], size: int) -> Iterator[list[Capture]]:
+    """Split the captures into batches of the specified size."""
+    iterator = iter(captures)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def reparse(
+    archive_path: Union[str, Path],
+    output_dir: Union[str, Path] = REPARSE_DIR,
+    workers: Optional[int] = None,
+    batch_size: int = BATCH_SIZE,
+) -> ReparseStats:
+    """Re-parse every archived page and store the results.
+
+    Pages are parsed in a process pool, one worker per core by default. Job
+    sections are stored per homepage capture, in files named after the
+    account and the capture time. The contact info and profile pages update
+    the ``ProfileHistory`` of their account under ``profile-history``, as
+    the scanners do, in capture time order.
+    """
+    archive = PageArchive(archive_path)
+    captures = archive.captures()
+    archive.close()
+    workers = workers or os.cpu_count()
+    histories: dict[str, ProfileHistory] = {}
+    pages = failures = 0
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_open_archive, initargs=(str(archive_path),)
+    ) as executor:
+        for batch in _batches(captures, batch_size):
+            chunksize = max(1, len(batch) // (workers * 4))
+            results = executor.map(reparse_capture, batch, chunksize=chunksize)
+            for capture, result in zip(batch, results):
+                pages += 1
+                if isinstance(result, str):
+                    failures += 1
+                    logger.warning(
+                        f"Could not parse {capture.page_type} captured at "
+                        f"{capture.captured_at}: {result}"
+                    )
+                    continue
+                account = capture.account or DEFAULT_ACCOUNT
+                if capture.page_type == "homepage":
+                    datetime_now = capture.captured_at.strftime("%Y-%m-%d %H:%M:%S")
+                    job_sections = [job_section.dict() for job_section in result]
+                    name = f"homepage-{account}"
+                    store_locally(name, datetime_now, job_sections, output_dir)
+                    continue
+                if capture.page_type == "contactinfo":
+                    account_fields, location_fields = result
+                    sections = {
+                        "account_session": account_fields,
+                        "location_session": location_fields,
+                    }
+                else:
+                    sections = {"profile_page": result}
+                if account not in histories:
+                    histories[account] = ProfileHistory(
+                        account, Path(output_dir, "profile-history")
+                    )
+                try:
+                    histories[account].update(sections, capture.captured_at)
+                except Exception as error:
+                    # The section validators raise more than ValidationError,
+                    # e.g. TypeError on a missing field.
+                    failures += 1
+                    logger.warning(
+                        f"Could not parse {capture.page_type} captured at "
+                        f"{capture.captured_at}: {error}"
+                    )
+    stats = ReparseStats(
+        pages=pages, failures=failures, seconds=time.perf_counter() - start
+    )
+
+    logger.info(
+        f"Re-parsed {stats.pages} pages ({stats.failures} failed) with {workers} "
+        f"workers at {stats.pages_per_second:.1f} pages per second."
+    )
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-parse archived pages.")
+    parser.add_argument("archive_path", help="Path of the page archive.")
+    parser.add_argument(
+        "--output-dir", default=REPARSE_DIR, help="Output directory."
+    )
+    parser.add_argument("--workers", type=int, help="Number of worker processes.")
+    arguments = parser.parse_args()
+    reparse(arguments.archive_path, arguments.output_dir, arguments.workers)
@@ -0,0 +1,205 @@
+"""A module for replaying recorded driver sessions without a browser."""
+
+import builtins
+import json
+from collections import defaultdict, deque
+from typing import Any
+
+from selenium.common import exceptions as selenium_exceptions
+
+from upwork_scraper.browser import AsyncBrowser, AsyncBrowserSession, Browser
+from upwork_scraper.driver import (BASE_URL, CONTACT_INFO_PATH, HOMEPAGE_PATH,
+                                   LOGIN_PATH)
+from upwork_scraper.recording import Recording
+
+
+class ReplayError(Exception):
+    """Raised when a replayed session makes a call that was not recorded."""
+
+
+class RecordedError(Exception):
+    """Raised for a recorded error whose type is not known to the replay."""
+
+
+def recorded_error(error: dict) -> Exception:
+    """Rebuild the error a recorded call raised."""
+    for module in (selenium_exceptions, builtins):
+        error_type = getattr(module, error["type"], None)
+        if isinstance(error_type, type) and issubclass(error_type, Exception):
+            return error_type(error["message"])
+    return RecordedError(f"{error['type']}: {error['message']}")
+
+
+class ReplayDriver(Browser):
+    """A driver serving the calls of a ``Recording`` instead of a browser.
+
+    Each call is answered with the next recorded result for the same method
+    and arguments. Once those are used up, the last one keeps being returned,
+    so extra checks (e.g. on a retry) still get an answer. The URLs are
+    built from the base URL of the recording, Upwork for older recordings.
+    """
+
+    def __init__(self, recording: Recording):
+        """Initialize the ReplayDriver with the specified recording."""
+        self.timeout: int = 0
+        self.timeout_for_checking_presence: int = 0
+        self.headless = True
+        self.replayed_recording = recording
+        self.current_url: str = ""
+        base_url = recording.base_url or BASE_URL
+        self.login_url: str = base_url + LOGIN_PATH
+        self.homepage_url: str = base_url + HOMEPAGE_PATH
+        self.contact_info_url: str = base_url + CONTACT_INFO_PATH
+        self._pending: dict[tuple, deque] = defaultdict(deque)
+        self._last: dict[tuple, dict] = {}
+        for call in recording.calls:
+            self._pending[self._key(call["method"], call["args"])].append(call)
+
+    @staticmethod
+    def _key(method: str, args: Any) -> tuple:
+        """Get the key a call is looked up by."""
+        return method, json.dumps(list(args))
+
+    def _replay(self, method: str, *args) -> Any:
+        """Return the recorded result for the specified call."""
+        key = self._key(method, args)
+        if self._pending[key]:
+            self._last[key] = self._pending[key].popleft()
+        elif key not in self._last:
+            raise ReplayError(f"No recorded call for {method}{args}.")
+        call = self._last[key]
+        self.current_url = call["url"]
+        if "error" in call:
+            raise recorded_error(call["error"])
+        return call["result"]
+
+    def go_to_url(self, url: str) -> None:
+        """Navigate the ReplayDriver to the specified URL."""
+        self._replay("go_to_url", url)
+
+    def enter_text_when_loaded(self, element_content: str, text: str) -> None:
+        """Enter text after element is loaded."""
+        self._replay("enter_text_when_loaded", element_content)
+
+    def click_element(self, element_content: str) -> None:
+        """Click the specified element."""
+        self._replay("click_element", element_content)
+
+    def get_profile_link(self, pattern: str) -> str:
+        """Get the recorded link matching the specified pattern."""
+        return self._replay("get_profile_link", pattern)
+
+    def is_logged(self) -> bool:
+        """Check if the user is logged in."""
+        return self._replay("is_logged")
+
+    def is_at_login_page(self) -> bool:
+        """Check if the ReplayDriver is at the login page, not logged in yet."""
+        return self._replay("is_at_login_page")
+
+    def is_at_homepage(self) -> bool:
+        """Check if the ReplayDriver is at the homepage."""
+        return self._replay("is_at_homepage")
+
+    def is_at_contact_info_page(self) -> bool:
+        """Check if the ReplayDriver is at the contact info page."""
+        return self._replay("is_at_contact_info_page")
+
+    def is_at_profile_page(self) -> bool:
+        """Check if the ReplayDriver is at the profile page."""
+        return self._replay("is_at_profile_page")
+
+    def get_page_source(self) -> str:
+        """Get the page source of the current webpage."""
+        result = self._replay("get_page_source")
+        return self.replayed_recording.get_page(result["page"])
+
+    def is_element_present(self, element_content: str) -> bool:
+        """Check if the element is present."""
+        return self._replay("is_element_present", element_content)
+
+    def is_element_present_by_xpath(self, element_content: str) -> bool:
+        """Check if the element is present."""
+        return self._replay("is_element_present_by_xpath", element_content)
+
+    def close(self) -> None:
+        """Close the ReplayDriver."""
+
+
+class AsyncReplayDriver(AsyncBrowser):
+    """An asynchronous page serving the calls of a ``ReplayDriver``."""
+
+    def __init__(self, replay_driver: ReplayDriver):
+        """Initialize the AsyncReplayDriver with the driver it delegates to."""
+        self.replay_driver = replay_driver
+        self.timeout: int = replay_driver.timeout
+        self.timeout_for_checking_presence: int = 0
+        self.login_url: str = replay_driver.login_url
+        self.homepage_url: str = replay_driver.homepage_url
+        self.contact_info_url: str = replay_driver.contact_info_url
+
+    async def go_to_url(self, url: str) -> None:
+        """Navigate the AsyncReplayDriver to the specified URL."""
+        self.replay_driver.go_to_url(url)
+
+    async def enter_text_when_loaded(self, element_content: str, text: str) -> None:
+        """Enter text after element is loaded."""
+        self.replay_driver.enter_text_when_loaded(element_content, text)
+
+    async def click_element(self, element_content: str) -> None:
+        """Click the specified element."""
+        self.replay_driver.click_element(element_content)
+
+    async def get_profile_link(self, pattern: str) -> str:
+        """Get the recorded link matching the specified pattern."""
+        return self.replay_driver.get_profile_link(pattern)
+
+    async def is_logged(self) -> bool:
+        """Check if the user is logged in."""
+        return self.replay_driver.is_logged()
+
+    async def is_at_login_page(self) -> bool:
+        """Check if the page is the login page, not logged in yet."""
+        return self.replay_driver.is_at_login_page()
+
+    async def is_at_homepage(self) -> bool:
+        """Check if the page is the homepage."""
+        return self.replay_driver.is_at_homepage()
+
+    async def is_at_contact_info_page(self) -> bool:
+        """Check if the page is the contact info page."""
+        return self.replay_driver.is_at_contact_info_page()
+
+    async def is_at_profile_page(self) -> bool:
+        """Check if the page is the profile page."""
+        return self.replay_driver.is_at_profile_page()
+
+    async def get_page_source(self) -> str:
+        """Get the page source of the current webpage."""
+        return self.replay_driver.get_page_source()
+
+    async def is_element_present(self, element_content: str) -> bool:
+        """Check if the element is present."""
+        return self.replay_driver.is_element_present(element_content)
+
+    async def is_element_present_by_xpath(self, element_content: str) -> bool:
+        """Check if the element is present."""
+        return self.replay_driver.is_element_present_by_xpath(element_content)
+
+    async def close(self) -> None:
+        """Close the AsyncReplayDriver."""
+
+
+class AsyncReplaySession(AsyncBrowserSession):
+    """A session whose pages all serve the calls of the same recording."""
+
+    def __init__(self, recording: Recording):
+        """Initialize the AsyncReplaySession with the specified recording."""
+        self.replay_driver = ReplayDriver(recording)
+
+    async def new_page(self) -> AsyncReplayDriver:
+        """Open a new page in the session."""
+        return AsyncReplayDriver(self.replay_driver)
+
+    async def close(self) -> None:
+        """Close the AsyncReplaySession."""
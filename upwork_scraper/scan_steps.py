@@ -0,0 +1,188 @@
+"""A module with the scan steps shared by the sync and async scanners.
+
+Each scan is written once, as a generator yielding its steps and receiving
+their results. A step is either a ``Command`` of the browser or blocking
+``Work``, such as parsing, archiving or storing a page. ``run_steps`` runs
+the steps on a ``Browser``, while ``run_async_steps`` awaits the commands
+of an ``AsyncBrowser`` and runs the work in a thread, off the event loop.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Any, Callable, Generator, NamedTuple, TypeVar, Union
+
+from upwork_scraper.browser import AsyncBrowser, Browser
+from upwork_scraper.driver import DriverManager
+from upwork_scraper.logger import logger
+from upwork_scraper.models.profile import Profile
+from upwork_scraper.parsers import (extract_contact_info_fields,
+                                    extract_profile_page_fields,
+                                    parse_homepage)
+from upwork_scraper.profile_history import ProfileHistory
+from upwork_scraper.storage import DEFAULT_ACCOUNT, store_locally
+
+T = TypeVar("T")
+
+
+class Command(NamedTuple):
+    """A command of the browser, called with the arguments."""
+
+    name: str
+    args: tuple = ()
+
+
+class Work(NamedTuple):
+    """A blocking function, called with the arguments."""
+
+    function: Callable
+    args: tuple = ()
+
+
+Steps = Generator[Union[Command, Work], Any, T]
+
+
+def run_steps(driver: Browser, steps: Steps[T]) -> T:
+    """Run the steps on a synchronous browser and return their result."""
+    result = None
+    while True:
+        try:
+            step = steps.send(result)
+        except StopIteration as stop:
+            return stop.value
+        if isinstance(step, Command):
+            result = getattr(driver, step.name)(*step.args)
+        else:
+            result = step.function(*step.args)
+
+
+async def run_async_steps(driver: AsyncBrowser, steps: Steps[T]) -> T:
+    """Run the steps on an asynchronous browser and return their result."""
+    result = None
+    while True:
+        try:
+            step = steps.send(result)
+        except StopIteration as stop:
+            return stop.value
+        if isinstance(step, Command):
+            result = await getattr(driver, step.name)(*step.args)
+        else:
+            result = await asyncio.to_thread(step.function, *step.args)
+
+
+def login_steps(manager: DriverManager) -> Steps[None]:
+    """Get the steps of the login process."""
+    yield Command("go_to_url", (manager.driver.login_url,))
+
+    if not (yield Command("is_at_login_page")):
+        logger.info("Already logged in.")
+        return
+
+    logger.info("Login page loaded successfully.")
+    yield Command("enter_text_when_loaded", ("login_username", manager.username))
+    yield Command("click_element", ("login_password_continue",))
+
+    logger.info("Password page loaded successfully.")
+    yield Command("enter_text_when_loaded", ("login_password", manager.password))
+    yield Command("click_element", ("login_control_continue",))
+
+    if not (yield Command("is_logged")):
+        logger.info("Secret answer page loaded successfully.")
+        yield Command(
+            "enter_text_when_loaded", ("login_answer", manager.secret_answer)
+        )
+        yield Command("click_element", ("login_control_continue",))
+
+
+def parse_job_sections(page_source: str) -> list[dict]:
+    """Parse the job sections of the homepage into dictionaries."""
+    return [job_section.dict() for job_section in parse_homepage(page_source)]
+
+
+def homepage_steps(manager: DriverManager) -> Steps[list[dict]]:
+    """Get the steps scanning the homepage for its job sections."""
+    if not (yield Command("is_at_homepage")):
+        yield Command("go_to_url", (manager.driver.homepage_url,))
+    logger.info("Homepage loaded successfully.")
+
+    page_source = yield Command("get_page_source")
+    yield Work(manager._archive_page_source, ("homepage", page_source))
+    logger.info("Page source extracted successfully.")
+
+    job_sections = yield Work(parse_job_sections, (page_source,))
+    logger.info("Job sections parsed successfully.")
+
+    yield Work(store_locally, ("homepage", manager.datetime_now, job_sections))
+    logger.info("Job sections stored successfully.")
+    return job_sections
+
+
+def contact_info_steps(manager: DriverManager) -> Steps[tuple[dict, dict]]:
+    """Get the steps extracting the raw fields of the contact info page."""
+    if not (yield Command("is_at_contact_info_page")):
+        yield Command("go_to_url", (manager.driver.contact_info_url,))
+
+    if (yield Command("is_element_present", ("deviceAuth_answer",))):
+        yield Command(
+            "enter_text_when_loaded", ("deviceAuth_answer", manager.secret_answer)
+        )
+        yield Command("click_element", ("control_save",))
+        logger.info("Secret answer page loaded successfully.")
+
+    if (yield Command("is_element_present", ("reenterPassword",))):
+        yield Command(
+            "enter_text_when_loaded", ("sensitiveZone_password", manager.password)
+        )
+        yield Command("click_element", ("control_continue",))
+
+    logger.info("Contact-info page loaded successfully.")
+    page_source = yield Command("get_page_source")
+    yield Work(manager._archive_page_source, ("contactinfo", page_source))
+
+    fields = yield Work(extract_contact_info_fields, (page_source,))
+    logger.info("Account and location sections extracted successfully.")
+    return fields
+
+
+def profile_page_steps(manager: DriverManager) -> Steps[dict]:
+    """Get the steps extracting the raw fields of the profile page."""
+    if not (yield Command("is_at_profile_page")):
+        profile_url = yield Command("get_profile_link", ("/freelancers/",))
+        yield Command("go_to_url", (profile_url,))
+    logger.info("Profile page loaded successfully.")
+
+    page_source = yield Command("get_page_source")
+    yield Work(manager._archive_page_source, ("profilepage", page_source))
+
+    fields = yield Work(extract_profile_page_fields, (page_source,))
+    logger.info("Profile sections extracted successfully.")
+    return fields
+
+
+def update_profile_history(
+    account: str, sections: dict[str, dict], captured_at: datetime
+) -> tuple[Profile, list[str]]:
+    """Store the changed profile sections and rebuild the latest profile."""
+    history = ProfileHistory(account)
+    changed_sections = history.update(sections, captured_at)
+    return history.profile_at(), changed_sections
+
+
+def profile_steps(manager: DriverManager) -> Steps[Profile]:
+    """Get the steps scanning the profile and storing its changes."""
+    account_fields, location_fields = yield from contact_info_steps(manager)
+    profile_fields = yield from profile_page_steps(manager)
+
+    profile, changed_sections = yield Work(
+        update_profile_history,
+        (
+            manager.username or DEFAULT_ACCOUNT,
+            {
+                "account_session": account_fields,
+                "location_session": location_fields,
+                "profile_page": profile_fields,
+            },
+            datetime.strptime(manager.datetime_now, "%Y-%m-%d %H:%M:%S"),
+        ),
+    )
+    logger.info(f"Profile sections changed: {changed_sections or 'none'}.")
+    return profile
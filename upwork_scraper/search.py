@@ -0,0 +1,427 @@
+"""A module for indexing and searching scanned job sections."""
+
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+FIELDS: tuple[str, ...] = ("skill", "term", "country", "job_type")
+TOKEN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+Range = tuple[Optional[float], Optional[float]]
+DateRange = tuple[Optional[datetime], Optional[datetime]]
+
+
+def normalize(value: str) -> str:
+    """Lowercase a value and collapse consecutive whitespaces."""
+    return " ".join(value.lower().split())
+
+
+def tokenize(text: str) -> set[str]:
+    """Split a text into its normalized terms."""
+    return set(TOKEN.findall(text.lower()))
+
+
+def make_terms(field: str, value: str) -> list[str]:
+    """Make the index terms of a field value, e.g. ``skill:python``."""
+    if field not in FIELDS:
+        raise ValueError(f"Unknown field: {field}.")
+    if field == "term":
+        return [f"term:{token}" for token in sorted(tokenize(value))]
+    return [f"{field}:{normalize(value)}"]
+
+
+def parse_query_terms(queries: Iterable[str]) -> list[str]:
+    """Parse ``field:value`` queries into index terms."""
+    terms = []
+    for query in queries:
+        field, _, value = query.partition(":")
+        terms.extend(make_terms(field, value))
+    return terms
+
+
+def job_terms(job: dict) -> set[str]:
+    """Get the index terms of a job section."""
+    terms = set()
+    for skill in job.get("skills") or []:
+        terms.update(make_terms("skill", skill))
+    for text in (job.get("title"), job.get("description")):
+        if text:
+            terms.update(make_terms("term", text))
+    for field in ("country", "job_type"):
+        if job.get(field):
+            terms.update(make_terms(field, job[field]))
+    return terms
+
+
+def to_number(value: Optional[str]) -> float:
+    """Convert a budget to a number, NaN if it is missing."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def to_timestamp(value: Optional[str]) -> float:
+    """Convert an ISO date to a timestamp, NaN if it is not one."""
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class Segment:
+    """An immutable part of the index holding the postings of some jobs.
+
+    Postings are stored as delta-encoded, zlib compressed uint32 arrays,
+    which keeps them compact on disk, and decoded once when loaded.
+    """
+
+    def __init__(
+        self,
+        terms: list[str],
+        offsets: np.ndarray,
+        postings: np.ndarray,
+        budget: np.ndarray,
+        posted_on: np.ndarray,
+        doc_offsets: np.ndarray,
+        links: np.ndarray,
+    ):
+        """Initialize the Segment with its decoded arrays."""
+        self.terms = {term: index for index, term in enumerate(terms)}
+        self.offsets = offsets
+        self.postings = postings
+        self.budget = budget
+        self.posted_on = posted_on
+        self.doc_offsets = doc_offsets
+        self.links = links
+
+    @classmethod
+    def build(cls, jobs: list[dict], first_id: int, doc_offsets: list[int]):
+        """Build a segment for the jobs, numbered from ``first_id``."""
+        term_ids: dict[str, int] = {}
+        pair_terms: list[int] = []
+        pair_docs: list[int] = []
+        for doc_id, job in enumerate(jobs, start=first_id):
+            for term in job_terms(job):
+                pair_terms.append(term_ids.setdefault(term, len(term_ids)))
+                pair_docs.append(doc_id)
+
+        terms = sorted(term_ids)
+        rank = np.empty(len(terms), dtype=np.int64)
+        rank[[term_ids[term] for term in terms]] = np.arange(len(terms))
+        pair_ranks = rank[np.asarray(pair_terms, dtype=np.int64)]
+        order = np.lexsort((np.asarray(pair_docs, dtype=np.uint32), pair_ranks))
+        counts = np.bincount(pair_ranks, minlength=len(terms))
+        offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        return cls(
+            terms,
+            offsets,
+            np.asarray(pair_docs, dtype=np.uint32)[order],
+            np.array([to_number(job.get("budget")) for job in jobs]),
+            np.array([to_timestamp(job.get("posted_on")) for job in jobs]),
+            np.asarray(doc_offsets, dtype=np.int64),
+            np.array([job.get("suffix_link") or "" for job in jobs], dtype=str),
+        )
+
+    @classmethod
+    def merge(cls, segments: list["Segment"]) -> "Segment":
+        """Merge segments, which must be in doc id order, into one."""
+        terms = sorted(set().union(*(segment.terms for segment in segments)))
+        postings: list[np.ndarray] = []
+        counts: list[int] = []
+        for term in terms:
+            parts = [segment.get(term) for segment in segments if term in segment.terms]
+            postings.extend(parts)
+            counts.append(sum(map(len, parts)))
+        return cls(
+            terms,
+            np.concatenate(([0], np.cumsum(counts))).astype(np.int64),
+            np.concatenate(postings).astype(np.uint32),
+            np.concatenate([segment.budget for segment in segments]),
+            np.concatenate([segment.posted_on for segment in segments]),
+            np.concatenate([segment.doc_offsets for segment in segments]),
+            np.concatenate([segment.links for segment in segments]),
+        )
+
+    def __len__(self) -> int:
+        """Return the number of jobs in the segment."""
+        return len(self.doc_offsets)
+
+    def get(self, term: str) -> np.ndarray:
+        """Get the sorted doc ids of a term."""
+        index = self.terms.get(term)
+        if index is None:
+            return np.empty(0, dtype=np.uint32)
+        return self.postings[self.offsets[index] : self.offsets[index + 1]]
+
+    def save(self, path: Path) -> None:
+        """Save the segment with its postings delta-encoded."""
+        deltas = np.diff(self.postings.astype(np.int64), prepend=0)
+        # The first doc id of each term is stored as is.
+        starts = self.offsets[:-1][np.diff(self.offsets) > 0]
+        deltas[starts] = self.postings[starts]
+        np.savez_compressed(
+            path,
+            terms=np.array(list(self.terms), dtype=str),
+            offsets=self.offsets,
+            deltas=deltas.astype(np.uint32),
+            budget=self.budget,
+            posted_on=self.posted_on,
+            doc_offsets=self.doc_offsets,
+            links=self.links,
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "Segment":
+        """Load a segment saved with ``save``."""
+        with np.load(path) as data:
+            offsets = data["offsets"]
+            sums = np.cumsum(data["deltas"], dtype=np.int64)
+            counts = np.diff(offsets)
+            starts = offsets[:-1][counts > 0]
+            bases = sums[starts] - data["deltas"][starts]
+            postings = sums - np.repeat(bases, counts[counts > 0])
+            return cls(
+                data["terms"].tolist(),
+                offsets,
+                postings.astype(np.uint32),
+                data["budget"],
+                data["posted_on"],
+                data["doc_offsets"],
+                data["links"],
+            )
+
+
+class JobIndex:
+    """An inverted index over scanned job sections, persisted on disk.
+
+    Jobs are appended to ``jobs.jsonl`` and each batch of new jobs is
+    indexed in a new segment. A segment is merged with the previous one
+    once it is as large, so there are only logarithmically many segments
+    and updates rarely rewrite much of the index. Skills, title and
+    description terms, country and job type are indexed, and budget and
+    posted_on are kept as columns for range filters. Jobs are keyed by
+    their suffix link, so a job seen again in a later scan is not indexed
+    twice.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Initialize the JobIndex, loading it if it already exists."""
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._jobs_path = self.path / "jobs.jsonl"
+        segment_paths = sorted(self.path.glob("segment-*.npz"))
+        self._segment_number = (
+            int(segment_paths[-1].stem.split("-")[1]) if segment_paths else 0
+        )
+        self._segments: list[Segment] = []
+        self._segment_paths: list[Path] = []
+        for segment_path in segment_paths:
+            segment = Segment.load(segment_path)
+            # A merge interrupted after saving the merged segment leaves the
+            # segments it replaces behind, starting at or after its first job.
+            while (
+                self._segments
+                and self._segments[-1].doc_offsets[0] >= segment.doc_offsets[0]
+            ):
+                self._segments.pop()
+                self._segment_paths.pop().unlink()
+            self._segments.append(segment)
+            self._segment_paths.append(segment_path)
+        self._doc_ids_by_link: dict[str, int] = {}
+        first_id = 0
+        for segment in self._segments:
+            self._index_links(segment.links.tolist(), first_id)
+            first_id += len(segment)
+        self._refresh()
+
+    def _index_links(self, links: list[str], first_id: int) -> None:
+        """Map the suffix links of the jobs numbered from ``first_id``."""
+        for doc_id, link in enumerate(links, start=first_id):
+            if link:
+                self._doc_ids_by_link[link] = doc_id
+
+    def _refresh(self) -> None:
+        """Refresh the columns spanning all segments."""
+        self._budget = np.concatenate(
+            [np.empty(0)] + [segment.budget for segment in self._segments]
+        )
+        self._posted_on = np.concatenate(
+            [np.empty(0)] + [segment.posted_on for segment in self._segments]
+        )
+        self._doc_offsets = np.concatenate(
+            [np.empty(0, dtype=np.int64)]
+            + [segment.doc_offsets for segment in self._segments]
+        )
+        self._links = np.concatenate(
+            [np.empty(0, dtype=str)] + [segment.links for segment in self._segments]
+        )
+
+    def __len__(self) -> int:
+        """Return the number of indexed jobs."""
+        return len(self._doc_offsets)
+
+    def add(self, jobs: Iterable[dict]) -> int:
+        """Index the job sections not indexed yet and get their number.
+
+        Jobs whose suffix link is already indexed, or repeated in the same
+        batch, are skipped.
+        """
+        new_jobs = []
+        batch_links = set()
+        for job in jobs:
+            link = job.get("suffix_link")
+            if link and (link in self._doc_ids_by_link or link in batch_links):
+                continue
+            batch_links.add(link)
+            new_jobs.append(job)
+        jobs = new_jobs
+        if not jobs:
+            return 0
+        doc_offsets = []
+        with self._jobs_path.open("ab") as file:
+            for job in jobs:
+                doc_offsets.append(file.tell())
+                file.write(json.dumps(job).encode() + b"\n")
+
+        segment = Segment.build(jobs, len(self), doc_offsets)
+        self._index_links(segment.links.tolist(), len(self))
+        self._append_segment(segment)
+        while (
+            len(self._segments) > 1
+            and len(self._segments[-2]) <= len(self._segments[-1])
+        ):
+            self._merge_segments(2)
+        self._refresh()
+        return len(jobs)
+
+    def merge(self) -> None:
+        """Merge all segments into one."""
+        if len(self._segments) > 1:
+            self._merge_segments(len(self._segments))
+            self._refresh()
+
+    def _merge_segments(self, count: int) -> None:
+        """Merge the newest segments into one."""
+        segment = Segment.merge(self._segments[-count:])
+        merged_paths = self._segment_paths[-count:]
+        del self._segments[-count:]
+        del self._segment_paths[-count:]
+        # Save the merged segment before removing the old ones, so the jobs
+        # are on disk at every point.
+        self._append_segment(segment)
+        for path in merged_paths:
+            path.unlink()
+
+    def _append_segment(self, segment: Segment) -> None:
+        """Save a new segment after the existing ones."""
+        self._segment_number += 1
+        segment_path = self.path / f"segment-{self._segment_number:06d}.npz"
+        segment.save(segment_path)
+        self._segments.append(segment)
+        self._segment_paths.append(segment_path)
+
+    @property
+    def segments(self) -> list[Segment]:
+        """Return the segments of the index, in doc id order."""
+        return self._segments
+
+    @property
+    def links(self) -> np.ndarray:
+        """Return the suffix links of the jobs, empty if they have none."""
+        return self._links
+
+    def postings(self, term: str) -> np.ndarray:
+        """Get the sorted doc ids of an index term across all segments."""
+        return np.concatenate(
+            [np.empty(0, dtype=np.uint32)]
+            + [segment.get(term) for segment in self._segments]
+        )
+
+    def search(
+        self,
+        must: Iterable[str] = (),
+        should: Iterable[str] = (),
+        must_not: Iterable[str] = (),
+        budget: Optional[Range] = None,
+        posted_on: Optional[DateRange] = None,
+        limit: Optional[int] = None,
+    ) -> np.ndarray:
+        """Search the jobs, newest first.
+
+        Queries are ``field:value`` strings, with field one of ``skill``,
+        ``term``, ``country`` or ``job_type``. Jobs must match all of
+        ``must``, at least one of ``should`` if given and none of
+        ``must_not``. ``budget`` and ``posted_on`` are inclusive ranges,
+        either bound may be None.
+        """
+        must_terms = parse_query_terms(must)
+        should_terms = parse_query_terms(should)
+        doc_ids: Optional[np.ndarray] = None
+
+        for postings in sorted(map(self.postings, must_terms), key=len):
+            doc_ids = (
+                postings
+                if doc_ids is None
+                else np.intersect1d(doc_ids, postings, assume_unique=True)
+            )
+        if should_terms:
+            matches = np.unique(np.concatenate(list(map(self.postings, should_terms))))
+            doc_ids = (
+                matches
+                if doc_ids is None
+                else np.intersect1d(doc_ids, matches, assume_unique=True)
+            )
+
+        mask: Optional[np.ndarray] = None
+        if budget is not None:
+            mask = self._range_mask(self._budget, doc_ids, *budget)
+        if posted_on is not None:
+            low, high = (
+                bound.timestamp() if bound is not None else None for bound in posted_on
+            )
+            posted_mask = self._range_mask(self._posted_on, doc_ids, low, high)
+            mask = posted_mask if mask is None else mask & posted_mask
+
+        if doc_ids is None:
+            doc_ids = (
+                np.flatnonzero(mask).astype(np.uint32)
+                if mask is not None
+                else np.arange(len(self), dtype=np.uint32)
+            )
+        elif mask is not None:
+            doc_ids = doc_ids[mask]
+
+        for term in parse_query_terms(must_not):
+            doc_ids = np.setdiff1d(doc_ids, self.postings(term), assume_unique=True)
+
+        return doc_ids[::-1][:limit]
+
+    @staticmethod
+    def _range_mask(
+        column: np.ndarray,
+        doc_ids: Optional[np.ndarray],
+        low: Optional[float],
+        high: Optional[float],
+    ) -> np.ndarray:
+        """Get the mask of the docs whose value is within the range."""
+        values = column if doc_ids is None else column[doc_ids]
+        mask = ~np.isnan(values)
+        if low is not None:
+            mask &= values >= low
+        if high is not None:
+            mask &= values <= high
+        return mask
+
+    def get_jobs(self, doc_ids: Iterable[int]) -> list[dict]:
+        """Get the job sections of the specified doc ids."""
+        jobs = []
+        with self._jobs_path.open("rb") as file:
+            for doc_id in doc_ids:
+                file.seek(self._doc_offsets[doc_id])
+                jobs.append(json.loads(file.readline()))
+        return jobs
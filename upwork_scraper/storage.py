@@ -0,0 +1,19 @@
+"""A module for storing scanned data locally."""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+DATA_DIR: str = "data"
+# The account name used when USERNAME is not set
+DEFAULT_ACCOUNT: str = "default"
+
+
+def store_locally(
+    name: str, datetime_now: str, data: Any, directory: Union[str, Path] = DATA_DIR
+) -> Path:
+    """Store the data locally as a json file named after the scan time."""
+    file_path = Path(directory, f"{name}-{datetime_now}.json")
+    with file_path.open("w") as file:
+        json.dump(data, file, indent=4)
+    return file_path
@@ -0,0 +1,61 @@
+# tests/conftest.py
+
+import pytest
+
+from upwork_scraper.mock_site import contact_info_page, homepage, profile_page
+from upwork_scraper.recording import Recording
+
+
+@pytest.fixture
+def homepage_source():
+    return homepage()
+
+
+@pytest.fixture
+def contact_info_source():
+    return contact_info_page()
+
+
+@pytest.fixture
+def profile_source():
+    return profile_page()
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "data"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def recording(homepage_source, contact_info_source, profile_source):
+    recording = Recording()
+    login_url = "https://www.upwork.com/ab/account-security/login"
+    homepage_url = "https://www.upwork.com/nx/find-work/best-matches"
+    contact_info_url = "https://www.upwork.com/freelancers/settings/contactInfo"
+    profile_url = "https://www.upwork.com/freelancers/~01"
+    calls = [
+        ("go_to_url", [login_url], None, login_url),
+        ("is_at_login_page", [], True, login_url),
+        ("enter_text_when_loaded", ["login_username"], None, login_url),
+        ("click_element", ["login_password_continue"], None, login_url),
+        ("enter_text_when_loaded", ["login_password"], None, login_url),
+        ("click_element", ["login_control_continue"], None, homepage_url),
+        ("is_logged", [], True, homepage_url),
+        ("is_at_homepage", [], True, homepage_url),
+        ("get_page_source", [], homepage_source, homepage_url),
+        ("is_at_contact_info_page", [], False, homepage_url),
+        ("go_to_url", [contact_info_url], None, contact_info_url),
+        ("is_element_present", ["deviceAuth_answer"], False, contact_info_url),
+        ("is_element_present", ["reenterPassword"], False, contact_info_url),
+        ("get_page_source", [], contact_info_source, contact_info_url),
+        ("is_at_profile_page", [], False, contact_info_url),
+        ("get_profile_link", ["/freelancers/"], profile_url, contact_info_url),
+        ("go_to_url", [profile_url], None, profile_url),
+        ("get_page_source", [], profile_source, profile_url),
+    ]
+    for method, args, result, url in calls:
+        recording.add_call(method, args, result, url)
+    return recording
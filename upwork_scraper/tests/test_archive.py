@@ -0,0 +1,104 @@
+# tests/test_archive.py
+
+import threading
+from datetime import datetime
+
+import pytest
+
+from upwork_scraper.archive import PageArchive, split_into_chunks
+from upwork_scraper.mock_site import homepage
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = PageArchive(tmp_path / "archive")
+    yield archive
+    archive.close()
+
+
+def test_split_into_chunks():
+    data = homepage(50).encode()
+    chunks = split_into_chunks(data)
+    assert len(chunks) > 1
+    assert b"".join(chunks) == data
+
+
+def test_get_returns_page_source(archive, homepage_source):
+    capture = archive.add("dave", "homepage", homepage_source)
+    assert archive.get(capture) == homepage_source
+
+
+def test_repeated_page_is_stored_once(archive):
+    archive.add("dave", "homepage", homepage(50))
+    chunks = archive.stats().chunks
+    archive.add("dave", "homepage", homepage(50))
+    stats = archive.stats()
+    assert stats.chunks == chunks
+    assert stats.dedup_ratio == pytest.approx(2.0)
+    assert stats.compression_ratio > 1
+
+
+def test_changed_page_reuses_unchanged_chunks(archive):
+    first = archive.add("dave", "homepage", homepage(50))
+    second = archive.add("dave", "homepage", homepage(52))
+    assert set(first.chunks) & set(second.chunks)
+    assert archive.get(second) == homepage(52)
+
+
+def test_captures_filters(archive, profile_source, contact_info_source):
+    archive.add("dave", "profilepage", profile_source, datetime(2023, 11, 13))
+    archive.add("dave", "contactinfo", contact_info_source, datetime(2023, 11, 14))
+    archive.add("anna", "profilepage", profile_source, datetime(2023, 11, 15))
+    assert len(archive.captures(account="dave")) == 2
+    assert len(archive.captures(page_type="profilepage")) == 2
+    assert len(archive.captures(since=datetime(2023, 11, 14))) == 2
+    assert [c.account for c in archive.captures(until=datetime(2023, 11, 14))] == [
+        "dave",
+        "dave",
+    ]
+
+
+def test_archive_is_reloaded_from_disk(tmp_path, homepage_source):
+    archive = PageArchive(tmp_path / "archive", codec="gzip")
+    archive.add("dave", "homepage", homepage_source)
+    archive.close()
+
+    reloaded = PageArchive(tmp_path / "archive")
+    assert reloaded.codec.name == "gzip"
+    assert len(reloaded) == 1
+    assert reloaded.get(reloaded.captures()[0]) == homepage_source
+    reloaded.close()
+
+
+def test_archive_defaults_to_gzip(tmp_path):
+    archive = PageArchive(tmp_path / "archive")
+    assert archive.codec.name == "gzip"
+    archive.close()
+
+
+def test_captures_out_of_order_are_kept_sorted(archive, homepage_source):
+    for day in (15, 13, 14):
+        archive.add("dave", "homepage", homepage_source, datetime(2023, 11, day))
+    captures = archive.captures("dave", "homepage", since=datetime(2023, 11, 14))
+    assert [capture.captured_at.day for capture in captures] == [14, 15]
+
+
+def test_concurrent_writers_share_one_archive(tmp_path):
+    writers = [PageArchive(tmp_path / "archive") for _ in range(2)]
+    pages = [homepage(cards) for cards in range(30, 46)]
+
+    def add_pages(index: int) -> None:
+        for cards in range(index, len(pages), 4):
+            writers[index % 2].add("dave", "homepage", pages[cards])
+
+    threads = [threading.Thread(target=add_pages, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    reloaded = PageArchive(tmp_path / "archive")
+    assert len(reloaded) == len(pages)
+    assert {reloaded.get(capture) for capture in reloaded} == set(pages)
+    for writer in (*writers, reloaded):
+        writer.close()
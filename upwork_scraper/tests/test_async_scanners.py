@@ -0,0 +1,59 @@
+# tests/test_async_scanners.py
+
+import asyncio
+import json
+import threading
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from upwork_scraper.async_main import scan
+from upwork_scraper.async_scanners import async_retry
+from upwork_scraper.profile_history import ProfileHistory
+from upwork_scraper.replay import AsyncReplaySession
+from upwork_scraper.scan_steps import Command, Work, run_async_steps
+
+
+def test_async_retry():
+    calls = []
+
+    @async_retry(tries=3, delay=0)
+    async def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ValueError("Not yet.")
+        return "done"
+
+    assert asyncio.run(flaky()) == "done"
+    assert len(calls) == 3
+
+
+def test_async_retry_raises_after_last_try():
+    @async_retry(tries=2, delay=0)
+    async def failing():
+        raise ValueError("Never.")
+
+    with pytest.raises(ValueError):
+        asyncio.run(failing())
+
+
+def test_scan_with_async_replay_session(recording, data_dir, monkeypatch):
+    monkeypatch.setenv("USERNAME", "dave")
+    asyncio.run(scan(AsyncReplaySession(recording)))
+    homepage_file = next(data_dir.glob("homepage-*.json"))
+    assert len(json.loads(homepage_file.read_text())) == 30
+    profile = ProfileHistory("dave", data_dir / "profile-history").profile_at()
+    assert profile.profile_page.job_title == "Software engineer"
+    assert profile.location_session.country == "NL"
+
+
+def test_async_steps_run_work_off_the_event_loop():
+    def steps():
+        url = yield Command("get_profile_link", ("/freelancers/",))
+        thread = yield Work(threading.get_ident)
+        return url, thread
+
+    driver = Mock(get_profile_link=AsyncMock(return_value="/freelancers/~01"))
+    url, thread = asyncio.run(run_async_steps(driver, steps()))
+    assert url == "/freelancers/~01"
+    assert thread != threading.get_ident()
@@ -0,0 +1,100 @@
+# tests/test_browser_profile.py
+
+import json
+import os
+import time
+from datetime import timedelta
+from unittest.mock import Mock
+
+from upwork_scraper.browser_profile import BrowserProfile
+from upwork_scraper.driver import ChromeDriver
+
+
+def test_acquire_is_cold_then_warm(tmp_path):
+    profile = BrowserProfile(tmp_path, "dave@argyle.com")
+    path = profile.acquire()
+    assert path == tmp_path / "dave_argyle.com" / "slot-0"
+    assert profile.is_warm is False
+    assert f"--user-data-dir={path}" in profile.chrome_arguments()
+    profile.release()
+
+    profile = BrowserProfile(tmp_path, "dave@argyle.com")
+    assert profile.acquire() == path
+    assert profile.is_warm is True
+    profile.release()
+
+
+def test_concurrent_profiles_do_not_share_a_slot(tmp_path):
+    first = BrowserProfile(tmp_path, "dave")
+    second = BrowserProfile(tmp_path, "dave")
+    assert first.acquire() != second.acquire()
+    first.release()
+    second.release()
+
+
+def test_stale_profiles_are_pruned(tmp_path):
+    profile = BrowserProfile(tmp_path, "anna")
+    path = profile.acquire()
+    profile.release()
+    stale = time.time() - timedelta(days=30).total_seconds()
+    os.utime(path / "last-used", (stale, stale))
+    os.utime(path, (stale, stale))
+
+    profile = BrowserProfile(tmp_path, "dave", max_age=timedelta(days=14))
+    profile.acquire()
+    profile.release()
+    assert not path.exists()
+    assert not (tmp_path / "anna" / "slot-0.lock").exists()
+
+
+def test_unreleased_stale_profiles_are_pruned(tmp_path):
+    path = tmp_path / "anna" / "slot-3"
+    path.mkdir(parents=True)
+    (tmp_path / "anna" / "slot-3.lock").touch()
+    stale = time.time() - timedelta(days=30).total_seconds()
+    os.utime(path, (stale, stale))
+
+    BrowserProfile(tmp_path, "dave").prune()
+    assert not path.exists()
+    assert not (tmp_path / "anna" / "slot-3.lock").exists()
+
+
+def test_record_time_to_first_card(tmp_path):
+    profile = BrowserProfile(tmp_path, "dave")
+    profile.acquire()
+    profile.record_time_to_first_card(4.0)
+    profile.release()
+    profile.acquire()
+    profile.record_time_to_first_card(1.5)
+    profile.release()
+    timings = json.loads((tmp_path / "dave" / "timings.json").read_text())
+    assert timings == {"cold": [4.0], "warm": [1.5]}
+
+
+def test_chrome_driver_releases_profile_on_close(tmp_path, monkeypatch):
+    monkeypatch.setattr(ChromeDriver, "_create_driver", lambda self: Mock())
+    chrome_driver = ChromeDriver(profile=BrowserProfile(tmp_path, "dave"))
+    chrome_driver.time_to_first_card = 2.0
+    chrome_driver.close()
+    assert (tmp_path / "dave" / "slot-0" / "last-used").exists()
+    assert (tmp_path / "dave" / "timings.json").exists()
+
+
+def test_time_to_first_card_is_measured_from_navigation(monkeypatch):
+    monkeypatch.setattr(ChromeDriver, "_create_driver", lambda self: Mock())
+    chrome_driver = ChromeDriver()
+    chrome_driver._driver.execute_script.return_value = 2500.0
+    chrome_driver.go_to_url(chrome_driver.homepage_url)
+    assert chrome_driver.time_to_first_card == 2.5
+    chrome_driver._driver.execute_script.assert_called_once_with(
+        "return performance.now()"
+    )
+
+
+def test_time_to_first_card_after_login_redirect(monkeypatch):
+    monkeypatch.setattr(ChromeDriver, "_create_driver", lambda self: Mock())
+    monkeypatch.setattr("upwork_scraper.driver.WebDriverWait", Mock())
+    chrome_driver = ChromeDriver()
+    chrome_driver._driver.execute_script.return_value = 3200.0
+    assert chrome_driver.is_at_homepage()
+    assert chrome_driver.time_to_first_card == 3.2
@@ -0,0 +1,66 @@
+# tests/test_logger.py
+
+import json
+import logging
+import queue
+import threading
+
+import pytest
+
+from upwork_scraper.logger import ContextQueueHandler, JsonFormatter, log_context
+
+
+@pytest.fixture
+def records():
+    records = queue.SimpleQueue()
+    test_logger = logging.getLogger("test_logger")
+    handler = ContextQueueHandler(records)
+    test_logger.addHandler(handler)
+    test_logger.propagate = False
+    yield test_logger, records
+    test_logger.removeHandler(handler)
+
+
+def test_json_lines_carry_the_context(records):
+    test_logger, records = records
+    with log_context(run="8f3a", account="worker@example.com"):
+        with log_context(stage="login"):
+            test_logger.info("Logged %s.", "in")
+        test_logger.info("Done.")
+    test_logger.info("Outside.")
+
+    lines = [json.loads(JsonFormatter().format(records.get_nowait())) for _ in "123"]
+    assert lines[0]["message"] == "Logged in."
+    assert lines[0]["stage"] == "login"
+    assert lines[1]["run"] == "8f3a" and "stage" not in lines[1]
+    assert "run" not in lines[2] and "account" not in lines[2]
+
+
+def test_context_is_kept_per_thread(records):
+    test_logger, records = records
+
+    def log_in_run(run: str) -> None:
+        with log_context(run=run):
+            test_logger.info(run)
+
+    threads = [
+        threading.Thread(target=log_in_run, args=(f"run-{index}",)) for index in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for _ in threads:
+        record = records.get_nowait()
+        assert record.run == record.msg
+
+
+def test_json_formatter_includes_the_traceback(records):
+    test_logger, records = records
+    try:
+        raise ValueError("Broken page.")
+    except ValueError:
+        test_logger.exception("Scan failed.")
+    line = json.loads(JsonFormatter().format(records.get_nowait()))
+    assert line["level"] == "ERROR"
+    assert "ValueError: Broken page." in line["exception"]
@@ -0,0 +1,91 @@
+# tests/test_mock_site.py
+
+import json
+import re
+import shutil
+import time
+from http.cookiejar import CookieJar
+from urllib.error import HTTPError
+from urllib.parse import urlencode
+from urllib.request import HTTPCookieProcessor, OpenerDirector, build_opener
+
+import pytest
+
+from upwork_scraper.driver import CONTACT_INFO_PATH, HOMEPAGE_PATH, LOGIN_PATH
+from upwork_scraper.main import handler
+from upwork_scraper.mock_site import MockUpworkSite
+from upwork_scraper.parsers import (get_page_soup, parse_account_section,
+                                    parse_homepage, parse_profile_section)
+
+HAS_CHROME = any(
+    shutil.which(name) for name in ("google-chrome", "chromium", "chromium-browser")
+)
+
+
+@pytest.fixture
+def site():
+    with MockUpworkSite(cards=40, secret_answer="answer") as site:
+        yield site
+
+
+def submit(opener: OpenerDirector, site: MockUpworkSite, page: str, value: str):
+    """Submit the login form of the page with the specified value."""
+    fields = dict(re.findall(r'type="hidden" name="(\w+)" value="([^"]*)"', page))
+    data = urlencode({**fields, "value": value}).encode()
+    return opener.open(site.base_url + LOGIN_PATH, data).read().decode()
+
+
+def test_mock_site_login_flow_and_pages(site):
+    opener = build_opener(HTTPCookieProcessor(CookieJar()))
+    page = opener.open(site.base_url + LOGIN_PATH).read().decode()
+    assert 'id="login_username"' in page
+    page = submit(opener, site, page, site.username)
+    assert 'id="login_password"' in page
+    page = submit(opener, site, page, site.password)
+    assert 'id="login_answer"' in page
+    page = submit(opener, site, page, "answer")
+
+    assert 'id="nav-notifications-label"' in page
+    assert len(parse_homepage(page)) == 40
+    page = opener.open(site.base_url + CONTACT_INFO_PATH).read().decode()
+    soup = get_page_soup(page)
+    assert soup.find(attrs={"data-test": "settings-nav"}) is not None
+    assert parse_account_section(soup).first_name == "Dave"
+    profile_link = soup.find("a", href=re.compile("/freelancers/"))["href"]
+    page = opener.open(site.base_url + profile_link).read().decode()
+    assert parse_profile_section(get_page_soup(page)).job_title == "Software engineer"
+
+
+def test_mock_site_rejects_wrong_password(site):
+    opener = build_opener(HTTPCookieProcessor(CookieJar()))
+    page = opener.open(site.base_url + LOGIN_PATH).read().decode()
+    page = submit(opener, site, page, site.username)
+    page = submit(opener, site, page, "wrong")
+    assert 'id="login_username"' in page
+    page = opener.open(site.base_url + HOMEPAGE_PATH).read().decode()
+    assert 'id="login_username"' in page
+
+
+def test_mock_site_injects_latency_and_failures():
+    with MockUpworkSite(latency=0.2) as site:
+        start = time.perf_counter()
+        build_opener().open(site.base_url + LOGIN_PATH).read()
+        assert time.perf_counter() - start >= 0.2
+
+    with MockUpworkSite(failure_rate=1.0) as site:
+        with pytest.raises(HTTPError) as error:
+            build_opener().open(site.base_url + LOGIN_PATH)
+        assert error.value.code == 503
+        assert site.failures == site.requests == 1
+
+
+@pytest.mark.skipif(not HAS_CHROME, reason="Chrome is not installed.")
+def test_handler_against_mock_site(site, data_dir, monkeypatch):
+    monkeypatch.setenv("UPWORK_URL", site.base_url)
+    monkeypatch.setenv("USERNAME", site.username)
+    monkeypatch.setenv("PASSWORD", site.password)
+    monkeypatch.setenv("SECRET_ANSWER", "answer")
+    timings = handler()
+    assert set(timings) == {"login", "homepage", "profile"}
+    homepage_file = next(data_dir.glob("homepage-*.json"))
+    assert len(json.loads(homepage_file.read_text())) == 40
@@ -0,0 +1,34 @@
+# tests/test_parsers.py
+
+from datetime import datetime
+
+from upwork_scraper.parsers import (parse_contact_info_page, parse_homepage,
+                                    parse_profile_page)
+
+
+def test_parse_homepage(homepage_source):
+    job_sections = parse_homepage(homepage_source, datetime(2023, 11, 13, 14))
+    assert len(job_sections) == 30
+    assert job_sections[0].title == "Python scraper 0"
+    assert job_sections[0].description == "Build a web scraper in Python."
+    assert job_sections[0].skills == ["Python", "Selenium"]
+    assert job_sections[0].budget == "500"
+    assert job_sections[0].posted_on == "2023-11-13T12:00:00"
+
+
+def test_parse_contact_info_page(contact_info_source):
+    account_section, location_section = parse_contact_info_page(contact_info_source)
+    assert account_section.full_name == "Dave Worker"
+    assert account_section.last_name == "Worker"
+    assert location_section.state == "NH"
+    assert location_section.country == "NL"
+    assert location_section.phone_number == "+31621466631"
+
+
+def test_parse_profile_page(profile_source):
+    profile_page = parse_profile_page(profile_source)
+    assert profile_page.hourly_rate == "70.00"
+    assert profile_page.skills == ["Python", "Selenium"]
+    assert profile_page.employment_history == [
+        {"title": "Software Engineer | Argyle", "period": "January 2020 - Present"}
+    ]
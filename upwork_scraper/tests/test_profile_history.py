@@ -0,0 +1,78 @@
+# tests/test_profile_history.py
+
+from datetime import datetime
+
+import pytest
+
+from upwork_scraper.parsers import (extract_account_fields,
+                                    extract_location_fields,
+                                    extract_profile_fields, get_page_soup)
+from upwork_scraper.profile_history import ProfileHistory
+
+
+@pytest.fixture
+def sections(contact_info_source, profile_source):
+    contact_info_soup = get_page_soup(contact_info_source)
+    return {
+        "account_session": extract_account_fields(contact_info_soup),
+        "location_session": extract_location_fields(contact_info_soup),
+        "profile_page": extract_profile_fields(get_page_soup(profile_source)),
+    }
+
+
+def test_unchanged_sections_are_skipped(sections, tmp_path, monkeypatch):
+    history = ProfileHistory("dave", tmp_path)
+    assert history.update(sections, datetime(2023, 11, 13)) == [
+        "account_session",
+        "location_session",
+        "profile_page",
+    ]
+    size = history.path.stat().st_size
+
+    history = ProfileHistory("dave", tmp_path)
+    # Without the models, validating any section would fail.
+    monkeypatch.setattr("upwork_scraper.profile_history.SECTION_MODELS", {})
+    assert history.update(sections, datetime(2023, 11, 14)) == []
+    assert history.path.stat().st_size == size
+
+
+def test_changes_store_only_changed_fields(sections, tmp_path):
+    history = ProfileHistory("dave", tmp_path)
+    history.update(sections, datetime(2023, 11, 13))
+    sections["profile_page"] = {**sections["profile_page"], "hourly_rate": "$80.00/hr"}
+    assert history.update(sections, datetime(2023, 11, 20)) == ["profile_page"]
+    assert history.changes[-1].changes == {"hourly_rate": "80.00"}
+
+
+def test_profile_at_rebuilds_the_profile_in_time(sections, tmp_path):
+    history = ProfileHistory("dave", tmp_path)
+    history.update(sections, datetime(2023, 11, 13))
+    sections["location_session"] = {**sections["location_session"], "city": "Utrecht"}
+    history.update(sections, datetime(2023, 11, 20))
+
+    history = ProfileHistory("dave", tmp_path)
+    assert history.profile_at(datetime(2023, 11, 1)) is None
+    before = history.profile_at(datetime(2023, 11, 15))
+    assert before.location_session.city == "Amsterdam"
+    assert before.location_session.country == "NL"
+    after = history.profile_at()
+    assert after.location_session.city == "Utrecht"
+    assert after.account_session.first_name == "Dave"
+    assert after.profile_page.skills == ["Python", "Selenium"]
+
+
+def test_invalid_section_leaves_history_unchanged(sections, tmp_path):
+    history = ProfileHistory("dave", tmp_path)
+    history.update(sections, datetime(2023, 11, 13))
+    size = history.path.stat().st_size
+    account = {**sections["account_session"], "masked_email": "d****@mail.com"}
+    location = {**sections["location_session"], "phone_number": None}
+    sections.update(account_session=account, location_session=location)
+
+    with pytest.raises(TypeError):
+        history.update(sections, datetime(2023, 11, 14))
+    assert len(history) == 3
+    assert history.path.stat().st_size == size
+
+    del sections["location_session"]
+    assert history.update(sections, datetime(2023, 11, 15)) == ["account_session"]
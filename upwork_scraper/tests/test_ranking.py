@@ -0,0 +1,75 @@
+# tests/test_ranking.py
+
+from datetime import datetime
+
+import pytest
+
+from upwork_scraper.models.profile import ProfilePage
+from upwork_scraper.ranking import JobRanker, profile_terms
+from upwork_scraper.search import JobIndex
+
+
+@pytest.fixture
+def profile_page():
+    return ProfilePage(
+        job_title="Python developer",
+        hourly_rate="$70.00/hr",
+        description="I build web scrapers.",
+        skills=["Python", "Selenium"],
+        employment_history=[],
+    )
+
+
+def make_job(title, description, skills, link=None, day=1):
+    return {
+        "title": title,
+        "suffix_link": link or f"/jobs/~{title}",
+        "description": description,
+        "skills": skills,
+        "posted_on": datetime(2023, 11, day).isoformat(),
+    }
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = JobIndex(tmp_path / "index")
+    index.add(
+        [
+            make_job("Logo design", "Design a logo.", ["Illustrator"]),
+            make_job("Python scraper", "Build web scrapers.", ["Python", "Selenium"]),
+        ]
+    )
+    index.add([make_job("Data pipeline", "Python ETL jobs.", ["Python"], day=2)])
+    return index
+
+
+def test_profile_terms(profile_page):
+    weights = profile_terms(profile_page)
+    assert weights["skill:python"] > weights["term:python"]
+    assert "term:scrapers" in weights
+
+
+def test_score(index, profile_page):
+    scores = JobRanker(index).score(profile_terms(profile_page))
+    assert scores.shape == (3,)
+    assert scores[0] == 0
+    assert 0 < scores[2] < scores[1] <= 1
+
+
+def test_shortlist(index, profile_page):
+    shortlist = JobRanker(index).shortlist(profile_page, limit=2)
+    assert [doc_id for doc_id, _ in shortlist] == [1, 2]
+    assert JobRanker(index).score({"skill:rust": 1.0}).tolist() == [0, 0, 0]
+
+
+def test_shortlist_lists_links_once(index, profile_page):
+    index.links[1] = "/jobs/~Data pipeline"
+    shortlist = JobRanker(index).shortlist(profile_page, limit=2)
+    assert [doc_id for doc_id, _ in shortlist] == [1, 0]
+
+
+def test_shortlist_posted_after(index, profile_page):
+    shortlist = JobRanker(index).shortlist(
+        profile_page, posted_after=datetime(2023, 11, 2)
+    )
+    assert [doc_id for doc_id, _ in shortlist] == [2]
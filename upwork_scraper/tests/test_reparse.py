@@ -0,0 +1,52 @@
+# tests/test_reparse.py
+
+import json
+from datetime import datetime
+
+from upwork_scraper.archive import Capture, PageArchive
+from upwork_scraper.profile_history import ProfileHistory
+from upwork_scraper.reparse import reparse
+
+
+def test_reparse(tmp_path, homepage_source, contact_info_source, profile_source):
+    archive = PageArchive(tmp_path / "archive")
+    archive.add("dave", "homepage", homepage_source, datetime(2023, 11, 13, 14))
+    archive.add("dave", "homepage", "<html>", datetime(2023, 11, 13, 15))
+    broken_card = '<section class="up-card-section up-card-list-section up-card-hover">'
+    archive.add("dave", "homepage", broken_card, datetime(2023, 11, 13, 16))
+    archive.add("anna", "profilepage", profile_source, datetime(2023, 11, 13, 16))
+    archive.add("dave", "contactinfo", contact_info_source, datetime(2023, 11, 13, 17))
+    # The location validators raise plain errors, e.g. on a missing phone number.
+    without_phone = contact_info_source.replace('data-test="phone"', "")
+    archive.add("dave", "contactinfo", without_phone, datetime(2023, 11, 13, 17, 30))
+    archive.add("dave", "profilepage", profile_source, datetime(2023, 11, 13, 18))
+    archive.close()
+    missing_chunk = Capture(
+        account="dave",
+        page_type="homepage",
+        captured_at=datetime(2023, 11, 13, 19),
+        size=1,
+        chunks=["0" * 32],
+    )
+    with (tmp_path / "archive" / "captures.jsonl").open("a") as file:
+        file.write(missing_chunk.model_dump_json() + "\n")
+    output_dir = tmp_path / "data"
+    output_dir.mkdir()
+
+    stats = reparse(tmp_path / "archive", output_dir, workers=2, batch_size=2)
+
+    assert stats.pages == 8
+    assert stats.failures == 3
+    homepage_file = output_dir / "homepage-dave-2023-11-13 14:00:00.json"
+    assert len(json.loads(homepage_file.read_text())) == 30
+    empty_homepage_file = output_dir / "homepage-dave-2023-11-13 15:00:00.json"
+    assert json.loads(empty_homepage_file.read_text()) == []
+    assert not list(output_dir.glob("profilepage-*.json"))
+    history = ProfileHistory("dave", output_dir / "profile-history")
+    assert len(history) == 3
+    assert history.profile_at(datetime(2023, 11, 13, 17)) is None
+    profile = history.profile_at(datetime(2023, 11, 13, 18))
+    assert profile.location_session.country == "NL"
+    assert profile.profile_page.job_title == "Software engineer"
+    anna_history = ProfileHistory("anna", output_dir / "profile-history")
+    assert [change.section for change in anna_history.changes] == ["profile_page"]
@@ -0,0 +1,124 @@
+# tests/test_replay.py
+
+import json
+from unittest.mock import Mock
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+
+from upwork_scraper.archive import PageArchive
+from upwork_scraper.driver import ChromeDriver
+from upwork_scraper.main import handler
+from upwork_scraper.profile_history import ProfileHistory
+from upwork_scraper.recording import Recording
+from upwork_scraper.replay import ReplayDriver, ReplayError
+
+
+def test_recording_round_trip(recording, tmp_path):
+    path = tmp_path / "session.json.gz"
+    recording.save(path)
+    loaded = Recording.load(path)
+    assert loaded.calls == recording.calls
+    assert loaded.pages == recording.pages
+
+
+def test_recording_stores_page_once(recording, homepage_source):
+    recording.add_call("get_page_source", [], homepage_source, "https://example.com/")
+    assert len(recording.pages) == 3
+
+
+def test_replay_driver_serves_recorded_calls(recording, homepage_source):
+    driver = ReplayDriver(recording)
+    assert driver.is_at_homepage() is True
+    assert driver.get_page_source() == homepage_source
+    assert driver.current_url == "https://www.upwork.com/nx/find-work/best-matches"
+    assert driver.is_at_homepage() is True
+
+
+def test_replay_driver_raises_on_unrecorded_call(recording):
+    driver = ReplayDriver(recording)
+    with pytest.raises(ReplayError):
+        driver.click_element("unknown_button")
+
+
+def test_handler_with_replay_driver(recording, data_dir, monkeypatch):
+    monkeypatch.setenv("USERNAME", "dave")
+    timings = handler(ReplayDriver(recording))
+    assert set(timings) == {"login", "homepage", "profile"}
+    homepage_file = next(data_dir.glob("homepage-*.json"))
+    assert len(json.loads(homepage_file.read_text())) == 30
+    profile = ProfileHistory("dave", data_dir / "profile-history").profile_at()
+    assert profile.account_session.first_name == "Dave"
+    assert profile.location_session.country == "NL"
+
+
+def test_handler_indexes_and_ranks_jobs(recording, data_dir, monkeypatch):
+    monkeypatch.setenv("INDEX_PATH", str(data_dir / "index"))
+    handler(ReplayDriver(recording))
+    shortlist_file = next(data_dir.glob("shortlist-*.json"))
+    shortlist = json.loads(shortlist_file.read_text())
+    assert len(shortlist) == 30
+    assert shortlist[0]["score"] > 0
+
+
+def test_handler_archives_pages_with_their_urls(recording, data_dir, monkeypatch):
+    monkeypatch.setenv("USERNAME", "dave")
+    monkeypatch.setenv("ARCHIVE_PATH", str(data_dir / "archive"))
+    handler(ReplayDriver(recording))
+    archive = PageArchive(data_dir / "archive")
+    urls = {capture.page_type: capture.url for capture in archive.captures()}
+    archive.close()
+    assert archive.codec.name == "gzip"
+    assert urls["homepage"] == "https://www.upwork.com/nx/find-work/best-matches"
+    assert urls["profilepage"] == "https://www.upwork.com/freelancers/~01"
+
+
+def test_chrome_driver_records_calls(monkeypatch, tmp_path):
+    browser = Mock(current_url="https://example.com/", page_source="<html></html>")
+    monkeypatch.setattr(ChromeDriver, "_create_driver", lambda self: browser)
+    monkeypatch.setattr(ChromeDriver, "_wait_until_loaded", lambda self, _: None)
+    path = tmp_path / "session.json.gz"
+    chrome_driver = ChromeDriver(record_path=str(path))
+    chrome_driver.go_to_url("https://example.com/")
+    chrome_driver.enter_text_when_loaded("login_password", "secret")
+    chrome_driver.get_page_source()
+    chrome_driver.close()
+
+    replay_driver = ReplayDriver(Recording.load(path))
+    replay_driver.go_to_url("https://example.com/")
+    replay_driver.enter_text_when_loaded("login_password", "another secret")
+    assert replay_driver.get_page_source() == "<html></html>"
+    assert "secret" not in json.dumps(Recording.load(path).calls)
+
+
+def test_replay_driver_raises_recorded_errors(monkeypatch, tmp_path):
+    browser = Mock(current_url="https://example.com/")
+    browser.find_element.side_effect = [NoSuchElementException("Not loaded."), Mock()]
+    monkeypatch.setattr(ChromeDriver, "_create_driver", lambda self: browser)
+    monkeypatch.setattr(ChromeDriver, "_wait_until_loaded", lambda self, _: None)
+    path = tmp_path / "session.json.gz"
+    chrome_driver = ChromeDriver(record_path=str(path))
+    with pytest.raises(NoSuchElementException):
+        chrome_driver.click_element("login_password_continue")
+    chrome_driver.click_element("login_password_continue")
+    chrome_driver.close()
+
+    replay_driver = ReplayDriver(Recording.load(path))
+    with pytest.raises(NoSuchElementException, match="Not loaded."):
+        replay_driver.click_element("login_password_continue")
+    replay_driver.click_element("login_password_continue")
+
+
+def test_replay_driver_uses_recorded_base_url(monkeypatch, tmp_path):
+    browser = Mock(current_url="http://127.0.0.1:8000/")
+    monkeypatch.setattr(ChromeDriver, "_create_driver", lambda self: browser)
+    path = tmp_path / "session.json.gz"
+    chrome_driver = ChromeDriver(
+        record_path=str(path), base_url="http://127.0.0.1:8000"
+    )
+    chrome_driver.go_to_url(chrome_driver.login_url)
+    chrome_driver.close()
+
+    replay_driver = ReplayDriver(Recording.load(path))
+    assert replay_driver.login_url == "http://127.0.0.1:8000/ab/account-security/login"
+    replay_driver.go_to_url(replay_driver.login_url)
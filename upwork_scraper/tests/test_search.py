@@ -0,0 +1,110 @@
+# tests/test_search.py
+
+from datetime import datetime
+
+import pytest
+
+from upwork_scraper.search import JobIndex, job_terms, make_terms
+
+
+def make_job(index, skills, country="United States", budget="500", day=1):
+    return {
+        "title": f"Job {index}",
+        "suffix_link": f"/jobs/~{index}",
+        "description": "Build a web scraper.",
+        "skills": skills,
+        "country": country,
+        "job_type": "Fixed-price",
+        "budget": budget,
+        "posted_on": datetime(2023, 11, day).isoformat(),
+    }
+
+
+@pytest.fixture
+def jobs():
+    return [
+        make_job(0, ["Python", "Selenium"], day=1),
+        make_job(1, ["Python"], country="Netherlands", budget="1000", day=2),
+        make_job(2, ["JavaScript", "C++"], budget=None, day=3),
+        make_job(3, ["Python", "Machine Learning"], budget="50", day=4),
+    ]
+
+
+@pytest.fixture
+def index(tmp_path, jobs):
+    index = JobIndex(tmp_path / "index")
+    for job in jobs:
+        index.add([job])
+    return index
+
+
+def test_make_terms():
+    assert make_terms("skill", " Machine  Learning") == ["skill:machine learning"]
+    assert make_terms("term", "C++ and C#") == ["term:and", "term:c#", "term:c++"]
+    with pytest.raises(ValueError):
+        make_terms("title", "Job")
+
+
+def test_job_terms(jobs):
+    terms = job_terms(jobs[2])
+    assert {"skill:c++", "term:scraper", "term:2", "country:united states"} <= terms
+
+
+def test_search_boolean(index):
+    assert index.search(must=["skill:python"]).tolist() == [3, 1, 0]
+    assert index.search(must=["skill:Python", "country:Netherlands"]).tolist() == [1]
+    assert index.search(should=["skill:selenium", "skill:c++"]).tolist() == [2, 0]
+    assert index.search(
+        must=["term:scraper"], must_not=["skill:python"]
+    ).tolist() == [2]
+    assert index.search(must=["skill:rust"]).tolist() == []
+
+
+def test_search_ranges(index):
+    assert index.search(budget=(100, None)).tolist() == [1, 0]
+    doc_ids = index.search(
+        must=["skill:python"],
+        budget=(None, 600),
+        posted_on=(datetime(2023, 11, 2), None),
+    )
+    assert doc_ids.tolist() == [3]
+    assert len(index.search(limit=2)) == 2
+
+
+def test_index_is_reloaded_from_disk(tmp_path, index, jobs):
+    reloaded = JobIndex(tmp_path / "index")
+    assert len(reloaded) == 4
+    assert len(list((tmp_path / "index").glob("segment-*.npz"))) == 1
+    assert reloaded.search(must=["skill:python"]).tolist() == [3, 1, 0]
+    assert reloaded.get_jobs([1]) == [jobs[1]]
+
+
+def test_merge(tmp_path, index, jobs):
+    index.add([make_job(4, ["Selenium"])])
+    index.merge()
+    assert len(list((tmp_path / "index").glob("segment-*.npz"))) == 1
+    assert index.search(must=["skill:selenium"]).tolist() == [4, 0]
+
+
+def test_interrupted_merge_is_recovered(tmp_path, index):
+    index.add([make_job(4, ["Selenium"])])
+    old_segments = {
+        path: path.read_bytes() for path in (tmp_path / "index").glob("segment-*.npz")
+    }
+    index.merge()
+    for path, data in old_segments.items():
+        path.write_bytes(data)
+
+    reloaded = JobIndex(tmp_path / "index")
+    assert len(reloaded) == 5
+    assert len(list((tmp_path / "index").glob("segment-*.npz"))) == 1
+    assert reloaded.search(must=["skill:selenium"]).tolist() == [4, 0]
+
+
+def test_add_skips_indexed_jobs(tmp_path, index, jobs):
+    assert index.add(jobs) == 0
+    assert index.add([jobs[0], make_job(4, ["Rust"]), make_job(4, ["Rust"])]) == 1
+    assert len(index) == 5
+    reloaded = JobIndex(tmp_path / "index")
+    assert reloaded.add(jobs + [make_job(4, ["Rust"])]) == 0
+    assert reloaded.search(must=["skill:python"]).tolist() == [3, 1, 0]
@@ -0,0 +1,134 @@
+# tests/test_watchdog.py
+
+import subprocess
+import time
+from unittest.mock import Mock
+
+import pytest
+from selenium.common.exceptions import (InvalidSessionIdException,
+                                        NoSuchElementException,
+                                        WebDriverException)
+
+from upwork_scraper.watchdog import (BrowserRestarted, BrowserWatchdog,
+                                     process_tree_rss)
+
+HOMEPAGE_URL = "http://127.0.0.1/nx/find-work/best-matches"
+
+
+@pytest.fixture
+def browsers():
+    """Create mock browsers, each backed by a real process."""
+    created = []
+
+    def create_browser(**methods):
+        process = subprocess.Popen(["sleep", "60"])
+        browser = Mock(pid=process.pid, current_url=HOMEPAGE_URL, **methods)
+        browser.get_cookies.return_value = [{"name": "token", "value": "1"}]
+        browser.kill.side_effect = lambda: (process.kill(), process.wait())
+        browser.process = process
+        created.append(browser)
+        return browser
+
+    yield created, create_browser
+    for browser in created:
+        browser.process.kill()
+        browser.process.wait()
+
+
+def test_process_tree_rss(browsers):
+    created, create_browser = browsers
+    assert process_tree_rss(create_browser().pid) > 0
+
+
+def test_watchdog_replaces_hung_browser(browsers):
+    created, create_browser = browsers
+    hang = Mock(side_effect=lambda: time.sleep(1))
+    factories = iter([lambda: create_browser(is_at_homepage=hang), create_browser])
+    watchdog = BrowserWatchdog(lambda: next(factories)(), command_timeout=0.2)
+    watchdog.go_to_url(HOMEPAGE_URL)
+
+    with pytest.raises(BrowserRestarted):
+        watchdog.is_at_homepage()
+    hung_browser, new_browser = created
+    assert hung_browser.process.poll() is not None
+    new_browser.add_cookies.assert_called_once_with([{"name": "token", "value": "1"}])
+    assert new_browser.go_to_url.call_args.args == (HOMEPAGE_URL,)
+    assert watchdog.is_at_homepage() is new_browser.is_at_homepage.return_value
+    assert watchdog.metrics.hangs == watchdog.metrics.restarts == 1
+
+
+def test_watchdog_replaces_crashed_browser(browsers):
+    created, create_browser = browsers
+
+    def crash():
+        created[0].process.kill()
+        created[0].process.wait()
+        raise ConnectionError("Chrome not reachable.")
+
+    watchdog = BrowserWatchdog(
+        lambda: create_browser(get_page_source=Mock(side_effect=crash))
+    )
+    with pytest.raises(BrowserRestarted):
+        watchdog.get_page_source()
+    assert len(created) == 2
+    assert watchdog.metrics.crashes == 1
+
+
+def test_watchdog_replaces_bloated_browser_on_navigation(browsers, tmp_path):
+    created, create_browser = browsers
+    watchdog = BrowserWatchdog(
+        create_browser, max_rss=1, check_interval=0, metrics_path=str(tmp_path)
+    )
+    watchdog.get_page_source()
+    assert len(created) == 1
+    assert watchdog.metrics.rss_bytes > 1
+
+    watchdog.go_to_url(HOMEPAGE_URL)
+    assert len(created) == 2
+    assert watchdog.metrics.memory_restarts == watchdog.metrics.restarts == 1
+    metrics = next(tmp_path.glob("browser-*.prom")).read_text()
+    assert 'upwork_browser_restarts{account=""} 1' in metrics
+    watchdog.close()
+    assert not list(tmp_path.glob("browser-*.prom"))
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        InvalidSessionIdException("invalid session id"),
+        WebDriverException("chrome not reachable"),
+        WebDriverException("session deleted because of page crash"),
+    ],
+)
+def test_watchdog_replaces_crashed_chrome_under_live_chromedriver(browsers, error):
+    created, create_browser = browsers
+    watchdog = BrowserWatchdog(
+        lambda: create_browser(get_page_source=Mock(side_effect=error))
+    )
+    with pytest.raises(BrowserRestarted):
+        watchdog.get_page_source()
+    assert created[0].process.poll() is not None
+    assert len(created) == 2
+    assert watchdog.metrics.crashes == 1
+
+
+def test_watchdog_raises_errors_of_live_browser(browsers):
+    created, create_browser = browsers
+    error = NoSuchElementException("no such element")
+    watchdog = BrowserWatchdog(
+        lambda: create_browser(is_element_present=Mock(side_effect=error))
+    )
+    with pytest.raises(NoSuchElementException):
+        watchdog.is_element_present("login_username")
+    assert len(created) == 1
+    assert watchdog.metrics.crashes == 0
+
+
+def test_watchdog_snapshots_session_only_after_navigation(browsers):
+    created, create_browser = browsers
+    watchdog = BrowserWatchdog(create_browser)
+    watchdog.get_page_source()
+    watchdog.is_at_homepage()
+    created[0].get_cookies.assert_not_called()
+    watchdog.go_to_url(HOMEPAGE_URL)
+    created[0].get_cookies.assert_called_once()
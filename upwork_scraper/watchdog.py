@@ -0,0 +1,300 @@
+"""A module watching over the browser, replacing it when it hangs or bloats.
+
+A hung Chrome blocks its commands until Selenium gives up, minutes later,
+and a leaking one grows until the machine swaps, while ``@retry`` keeps
+retrying against the same broken browser. ``BrowserWatchdog`` runs every
+command under a deadline and tracks the RSS of the browser's process tree.
+A browser that hangs, crashes or outgrows its memory budget is killed and
+replaced by a fresh one with the session cookies of the old one.
+"""
+
+import contextvars
+import itertools
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as CommandTimeoutError
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import psutil
+from pydantic import BaseModel
+from selenium.common.exceptions import (InvalidSessionIdException,
+                                        WebDriverException)
+
+from upwork_scraper.browser import Browser
+from upwork_scraper.logger import logger
+
+MAX_RSS: int = 2 * 1024**3
+COMMAND_TIMEOUT: float = 60.0
+CHECK_INTERVAL: float = 5.0
+GAUGES: set[str] = {"rss_bytes", "peak_rss_bytes", "max_command_seconds"}
+# Errors of chromedriver when Chrome died while chromedriver itself lives on.
+CRASH_MESSAGES: tuple[str, ...] = (
+    "chrome not reachable",
+    "session deleted",
+    "disconnected",
+    "tab crashed",
+)
+# Commands which may change the page or the cookies to restore.
+SNAPSHOT_COMMANDS: set[str] = {"go_to_url", "click_element", "is_logged"}
+
+_watchdog_ids = itertools.count()
+
+
+class BrowserRestarted(Exception):
+    """Raised when the browser was replaced while running a command."""
+
+
+class WatchdogMetrics(BaseModel):
+    """Metrics of the browsers run by a watchdog."""
+
+    commands: int = 0
+    command_seconds: float = 0.0
+    max_command_seconds: float = 0.0
+    rss_bytes: int = 0
+    peak_rss_bytes: int = 0
+    restarts: int = 0
+    hangs: int = 0
+    crashes: int = 0
+    memory_restarts: int = 0
+
+    def to_prometheus(self, account: str) -> str:
+        """Format the metrics in the Prometheus text format."""
+        lines = []
+        for name, value in self.dict().items():
+            metric = f"upwork_browser_{name}"
+            kind = "gauge" if name in GAUGES else "counter"
+            lines.append(f"# TYPE {metric} {kind}")
+            lines.append(f'{metric}{{account="{account}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+
+def process_tree_rss(pid: int) -> int:
+    """Get the total RSS in bytes of the process and its descendants."""
+    try:
+        root = psutil.Process(pid)
+        processes = [root, *root.children(recursive=True)]
+    except psutil.NoSuchProcess:
+        return 0
+    rss = 0
+    for process in processes:
+        try:
+            rss += process.memory_info().rss
+        except psutil.NoSuchProcess:
+            pass
+    return rss
+
+
+def is_process_alive(pid: int) -> bool:
+    """Check if the process is running."""
+    try:
+        return psutil.Process(pid).status() != psutil.STATUS_ZOMBIE
+    except psutil.NoSuchProcess:
+        return False
+
+
+def is_crash(error: Exception) -> bool:
+    """Check if the WebDriver error means Chrome is gone."""
+    if isinstance(error, InvalidSessionIdException):
+        return True
+    message = (getattr(error, "msg", None) or "").lower()
+    return isinstance(error, WebDriverException) and any(
+        crash_message in message for crash_message in CRASH_MESSAGES
+    )
+
+
+class BrowserWatchdog(Browser):
+    """A browser replacing the ``ChromeDriver`` it runs when it misbehaves.
+
+    A command running longer than ``command_timeout`` seconds means the
+    browser hung: it is killed and replaced, the session is restored and
+    ``BrowserRestarted`` is raised, so the ``@retry`` of the interrupted
+    stage replays it on the new browser. A browser found over ``max_rss``
+    bytes is replaced on the next navigation, where the page is dropped
+    anyway. When ``metrics_path`` is given, the metrics are exported there
+    in the Prometheus text format while the browser runs.
+    """
+
+    def __init__(
+        self,
+        create_browser: Callable[[], Browser],
+        max_rss: int = MAX_RSS,
+        command_timeout: float = COMMAND_TIMEOUT,
+        check_interval: float = CHECK_INTERVAL,
+        metrics_path: Optional[str] = None,
+        account: str = "",
+    ):
+        """Initialize the BrowserWatchdog, creating its first browser."""
+        self.max_rss = max_rss
+        self.command_timeout = command_timeout
+        self.check_interval = check_interval
+        self.metrics_path = metrics_path
+        self.account = account
+        self.metrics = WatchdogMetrics()
+        self._metrics_name = f"browser-{os.getpid()}-{next(_watchdog_ids)}.prom"
+        self._create_browser = create_browser
+        self._browser = create_browser()
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="browser")
+        self._url: Optional[str] = None
+        self._cookies: list[dict] = []
+        self._checked_at = time.monotonic()
+        self._over_budget = False
+
+    def __getattr__(self, name: str) -> Any:
+        """Get the other attributes, such as the URLs, from the browser."""
+        if name == "_browser":
+            raise AttributeError(name)
+        return getattr(self._browser, name)
+
+    def go_to_url(self, url: str) -> None:
+        """Navigate to the specified URL, first replacing a bloated browser."""
+        if self._over_budget:
+            self.metrics.memory_restarts += 1
+            self._replace(navigate=False)
+        self._run("go_to_url", url)
+
+    def enter_text_when_loaded(self, element_content: str, text: str) -> None:
+        """Enter text after element is loaded."""
+        self._run("enter_text_when_loaded", element_content, text)
+
+    def click_element(self, element_content: str) -> None:
+        """Click the specified element."""
+        self._run("click_element", element_content)
+
+    def get_profile_link(self, pattern: str) -> str:
+        """Get the link containing the specified pattern."""
+        return self._run("get_profile_link", pattern)
+
+    def is_logged(self) -> bool:
+        """Check if the user is logged in."""
+        return self._run("is_logged")
+
+    def is_at_login_page(self) -> bool:
+        """Check if the browser is at the login page, not logged in yet."""
+        return self._run("is_at_login_page")
+
+    def is_at_homepage(self) -> bool:
+        """Check if the browser is at the homepage."""
+        return self._run("is_at_homepage")
+
+    def is_at_contact_info_page(self) -> bool:
+        """Check if the browser is at the contact info page."""
+        return self._run("is_at_contact_info_page")
+
+    def is_at_profile_page(self) -> bool:
+        """Check if the browser is at the profile page."""
+        return self._run("is_at_profile_page")
+
+    def get_page_source(self) -> str:
+        """Get the page source of the current webpage."""
+        return self._run("get_page_source")
+
+    def is_element_present(self, element_content: str) -> bool:
+        """Check if the element is present."""
+        return self._run("is_element_present", element_content)
+
+    def is_element_present_by_xpath(self, element_content: str) -> bool:
+        """Check if the element is present."""
+        return self._run("is_element_present_by_xpath", element_content)
+
+    def close(self) -> None:
+        """Close the browser, log the final metrics and remove their file."""
+        self._executor.shutdown(wait=False)
+        self._browser.close()
+        if self.metrics_path is not None:
+            Path(self.metrics_path, self._metrics_name).unlink(missing_ok=True)
+        logger.info(
+            f"Browser watchdog: {self.metrics.restarts} restarts, "
+            f"peak RSS {self.metrics.peak_rss_bytes / 1024**2:.0f} MB, "
+            f"slowest command {self.metrics.max_command_seconds:.1f} s."
+        )
+
+    def _run(self, method: str, *args) -> Any:
+        """Run the command on the browser under the deadline."""
+        start = time.perf_counter()
+        future = self._executor.submit(
+            contextvars.copy_context().run, self._call, self._browser, method, args
+        )
+        try:
+            result, snapshot = future.result(self.command_timeout)
+        except CommandTimeoutError:
+            self.metrics.hangs += 1
+            logger.warning(f"Browser hung on {method}, replacing it.")
+            self._replace()
+            raise BrowserRestarted(f"Browser hung on {method}.")
+        except Exception as error:
+            if is_process_alive(self._browser.pid) and not is_crash(error):
+                raise
+            self.metrics.crashes += 1
+            logger.warning(f"Browser crashed on {method}, replacing it.")
+            self._replace()
+            raise BrowserRestarted(f"Browser crashed on {method}.") from error
+
+        if snapshot is not None:
+            self._url, self._cookies = snapshot
+        seconds = time.perf_counter() - start
+        self.metrics.commands += 1
+        self.metrics.command_seconds += seconds
+        self.metrics.max_command_seconds = max(
+            self.metrics.max_command_seconds, seconds
+        )
+        if time.monotonic() - self._checked_at >= self.check_interval:
+            self._check_memory()
+        return result
+
+    @staticmethod
+    def _call(browser: Browser, method: str, args: tuple) -> tuple:
+        """Call the method, then read the URL and cookies it may have changed."""
+        result = getattr(browser, method)(*args)
+        if method not in SNAPSHOT_COMMANDS:
+            return result, None
+        return result, (browser.current_url, browser.get_cookies())
+
+    def _check_memory(self) -> None:
+        """Measure the RSS of the browser, flagging it when over budget."""
+        self._checked_at = time.monotonic()
+        rss = process_tree_rss(self._browser.pid)
+        self.metrics.rss_bytes = rss
+        self.metrics.peak_rss_bytes = max(self.metrics.peak_rss_bytes, rss)
+        if rss > self.max_rss and not self._over_budget:
+            logger.warning(
+                f"Browser uses {rss / 1024**2:.0f} MB, "
+                "replacing it on the next navigation."
+            )
+            self._over_budget = True
+        self._export_metrics()
+
+    def _replace(self, navigate: bool = True) -> None:
+        """Kill the browser and start a new one with the same session."""
+        old_browser = self._browser
+        self._executor.shutdown(wait=False)
+        old_browser.kill()
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="browser")
+        self._browser = self._create_browser()
+        if getattr(old_browser, "recording", None) is not None:
+            self._browser.recording = old_browser.recording
+        self._over_budget = False
+        self.metrics.restarts += 1
+        if self._url is not None:
+            future = self._executor.submit(self._restore_session, navigate)
+            future.result(self.command_timeout)
+        self._export_metrics()
+
+    def _restore_session(self, navigate: bool) -> None:
+        """Restore the cookies and, if asked, the page of the old browser."""
+        self._browser.go_to_url(self._url)
+        self._browser.add_cookies(self._cookies)
+        if navigate:
+            self._browser.go_to_url(self._url)
+
+    def _export_metrics(self) -> None:
+        """Write the metrics to the metrics path, if there is one."""
+        if self.metrics_path is None:
+            return
+        directory = Path(self.metrics_path)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / self._metrics_name
+        temporary_path = path.with_suffix(".tmp")
+        temporary_path.write_text(self.metrics.to_prometheus(self.account))
+        temporary_path.replace(path)